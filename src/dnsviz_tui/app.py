@@ -1,5 +1,7 @@
 """Main Textual application for dnsviz-tui."""
 
+import os
+import traceback
 from datetime import datetime
 from pathlib import Path
 
@@ -10,6 +12,7 @@ from textual.widgets import Header, Footer, Input, Static, Label
 from textual.screen import ModalScreen
 from textual import work
 
+from dnsviz_tui.dns.cache import AnswerCache
 from dnsviz_tui.dns.resolver import DNSResolver
 from dnsviz_tui.dns.dnssec import DNSSECValidator
 from dnsviz_tui.models.chain import TrustChain, ValidationStatus
@@ -18,7 +21,7 @@ from dnsviz_tui.views.diagram_view import DiagramView
 from dnsviz_tui.views.table_view import TableView
 from dnsviz_tui.widgets.domain_input import DomainInput
 from dnsviz_tui.widgets.history_panel import HistoryPanel
-from dnsviz_tui.export.json_export import export_json
+from dnsviz_tui.export.json_export import write_json
 from dnsviz_tui.export.text_export import export_text
 
 
@@ -105,7 +108,7 @@ class ExportModal(ModalScreen[str | None]):
 
             if format in ("json", "both"):
                 json_path = base_path.with_suffix(".json")
-                export_json(self.chain, json_path)
+                write_json(self.chain, json_path)
                 exported.append(str(json_path))
 
             if format in ("text", "both"):
@@ -274,11 +277,13 @@ class DNSVizApp(App):
 
     def __init__(self):
         super().__init__()
-        self._resolver = DNSResolver()
+        self._resolver = DNSResolver(answer_cache=AnswerCache())
         self._validator = DNSSECValidator(self._resolver)
         self._current_chain: TrustChain | None = None
         self._current_view = "tree"
         self._is_loading = False
+        self._views: dict[str, TreeView | DiagramView | TableView] = {}
+        self._dirty_views: set[str] = set()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -295,6 +300,14 @@ class DNSVizApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Cache widget references so updates don't walk the DOM each time
+        self._result = self.query_one("#result-display", Static)
+        self._history = self.query_one("#history-panel", HistoryPanel)
+        self._views = {
+            "tree": self.query_one("#tree-view", TreeView),
+            "diagram": self.query_one("#diagram-view", DiagramView),
+            "table": self.query_one("#table-view", TableView),
+        }
         self.set_focus(None)  # Start with footer visible
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -303,49 +316,50 @@ class DNSVizApp(App):
             if domain and not self._is_loading:
                 self._query_domain(domain)
 
-    @work(thread=True)
-    def _query_domain(self, domain: str) -> None:
-        self.call_from_thread(self._set_loading, True, domain)
+    @work(exclusive=True)
+    async def _query_domain(self, domain: str) -> None:
+        self._set_loading(True, domain)
         try:
-            chain = self._validator.validate_chain(domain)
-            self.call_from_thread(self._set_chain, chain)
+            chain = await self._validator.validate_chain(domain)
+            self._set_chain(chain)
         except Exception as e:
-            import traceback
-            self.call_from_thread(self._handle_error, f"{e}\n{traceback.format_exc()}")
+            # Full tracebacks only when debugging, formatting them is costly
+            if os.environ.get("DNSVIZ_TUI_DEBUG") == "1":
+                self._handle_error(f"{e}\n{traceback.format_exc()}")
+            else:
+                self._handle_error(str(e))
         finally:
-            self.call_from_thread(self._set_loading, False, domain)
+            self._set_loading(False, domain)
 
     def _handle_error(self, error: str) -> None:
         self.notify("Error occurred", severity="error", timeout=5)
-        result = self.query_one("#result-display", Static)
-        result.update(f"Error:\n\n{error}")
-        result.remove_class("hidden")
-        for v in ["tree", "diagram", "table"]:
-            self.query_one(f"#{v}-view").add_class("hidden")
+        self._result.update(f"Error:\n\n{error}")
+        self._result.remove_class("hidden")
+        for widget in self._views.values():
+            widget.add_class("hidden")
 
     def _set_loading(self, loading: bool, domain: str) -> None:
         self._is_loading = loading
         if loading:
-            result = self.query_one("#result-display", Static)
-            result.update(f"⏳ Querying {domain}...")
-            result.remove_class("hidden")
-            for v in ["tree", "diagram", "table"]:
-                self.query_one(f"#{v}-view").add_class("hidden")
+            self._result.update(f"⏳ Querying {domain}...")
+            self._result.remove_class("hidden")
+            for widget in self._views.values():
+                widget.add_class("hidden")
 
     def _set_chain(self, chain: TrustChain) -> None:
         self._current_chain = chain
-        self.query_one("#result-display").add_class("hidden")
+        self._result.add_class("hidden")
 
-        self.query_one("#tree-view", TreeView).set_chain(chain)
-        self.query_one("#diagram-view", DiagramView).set_chain(chain)
-        self.query_one("#table-view", TableView).set_chain(chain)
+        # Only the visible view is updated now; the others catch up when shown
+        self._views[self._current_view].set_chain(chain)
+        self._dirty_views = set(self._views) - {self._current_view}
 
         self._switch_view(self._current_view)
-        self.query_one("#history-panel", HistoryPanel).add_entry(chain)
+        self._history.add_entry(chain)
 
         status = chain.overall_status
         self.notify(
-            f"{chain.target_domain}: {status.symbol} {status.value.upper()}",
+            f"{chain.target_domain}: {status.display_text}",
             severity="information" if status == ValidationStatus.SECURE else "warning",
             timeout=4
         )
@@ -354,9 +368,11 @@ class DNSVizApp(App):
     def _switch_view(self, view_name: str) -> None:
         if not self._current_chain:
             return
-        self.query_one("#result-display").add_class("hidden")
-        for v in ["tree", "diagram", "table"]:
-            widget = self.query_one(f"#{v}-view")
+        if view_name in self._dirty_views:
+            self._views[view_name].set_chain(self._current_chain)
+            self._dirty_views.discard(view_name)
+        self._result.add_class("hidden")
+        for v, widget in self._views.items():
             if v == view_name:
                 widget.remove_class("hidden")
             else:
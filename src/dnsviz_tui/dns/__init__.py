@@ -3,5 +3,6 @@
 from dnsviz_tui.dns.resolver import DNSResolver
 from dnsviz_tui.dns.dnssec import DNSSECValidator
 from dnsviz_tui.dns.records import RecordFormatter
+from dnsviz_tui.dns.cache import AnswerCache
 
-__all__ = ["DNSResolver", "DNSSECValidator", "RecordFormatter"]
+__all__ = ["DNSResolver", "DNSSECValidator", "RecordFormatter", "AnswerCache"]
@@ -0,0 +1,130 @@
+"""Persistent on-disk cache shared across TUI sessions."""
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory ($DNSVIZ_TUI_CACHE_DIR or the XDG cache home)."""
+    override = os.environ.get("DNSVIZ_TUI_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "dnsviz-tui"
+
+
+class _DiskStore:
+    """Expiring key -> blob table in a SQLite file, mirrored in memory.
+
+    Unexpired rows are loaded when the store is opened and expired ones are
+    deleted. Lookups are served from memory; writes to the database run in
+    order on a background thread so callers on the event loop never wait on
+    disk I/O. The store is best effort: if the database cannot be opened,
+    entries live in memory only and nothing is written.
+    """
+
+    FILENAME = ""
+    TABLE = ""
+
+    def __init__(self, path: Optional[Path | str] = None):
+        """Open (or create) the store and warm it from unexpired rows.
+
+        Args:
+            path: Database file. If None, uses FILENAME in default_cache_dir().
+        """
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[int, bytes]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+
+        try:
+            if path is None:
+                directory = default_cache_dir()
+                directory.mkdir(parents=True, exist_ok=True)
+                path = directory / self.FILENAME
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} "
+                "(key TEXT PRIMARY KEY, expiry INTEGER, value BLOB)"
+            )
+            now = int(time.time())
+            with conn:
+                conn.execute(f"DELETE FROM {self.TABLE} WHERE expiry <= ?", (now,))
+            for key, expiry, value in conn.execute(
+                f"SELECT key, expiry, value FROM {self.TABLE}"
+            ):
+                self._entries[key] = (expiry, value)
+            self._conn = conn
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"dnsviz-{self.TABLE}"
+            )
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    def _write(self, sql: str, params: tuple = ()) -> None:
+        """Queue a statement for the background writer, if the store has one."""
+        if self._writer is not None:
+            self._writer.submit(self._execute, sql, params)
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        """Run a single statement in its own transaction (writer thread)."""
+        try:
+            with self._conn:
+                self._conn.execute(sql, params)
+        except sqlite3.Error:
+            pass
+
+    def _get_blob(self, key: str) -> Optional[tuple[int, bytes]]:
+        """Return (expiry, blob) for an unexpired entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry
+
+    def _put_blob(self, key: str, blob: bytes, expiry: int) -> None:
+        """Store a blob until the POSIX time expiry."""
+        with self._lock:
+            self._entries[key] = (expiry, blob)
+        self._write(
+            f"INSERT OR REPLACE INTO {self.TABLE} (key, expiry, value) VALUES (?, ?, ?)",
+            (key, expiry, blob),
+        )
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk."""
+        with self._lock:
+            self._entries.clear()
+        self._write(f"DELETE FROM {self.TABLE}")
+
+
+class AnswerCache(_DiskStore):
+    """DNS responses in wire format, keyed by nameservers, name and type.
+
+    Lets a later session reuse answers (root and TLD keys above all) that
+    are still within their TTL instead of asking the network again.
+    """
+
+    FILENAME = "dnscache.db"
+    TABLE = "answers"
+
+    @staticmethod
+    def make_key(nameservers: Iterable[str], name: str, rdtype: str) -> str:
+        """Build a key for a query sent to a given set of nameservers."""
+        return f"{','.join(nameservers)}|{name}|{rdtype}"
+
+    def get(self, key: str) -> Optional[tuple[int, bytes]]:
+        """Return (POSIX expiry, response wire) for a cached answer, or None."""
+        return self._get_blob(key)
+
+    def put(self, key: str, wire: bytes, expiry: int) -> None:
+        """Store a response in wire format until the POSIX time expiry."""
+        if expiry <= time.time():
+            return
+        self._put_blob(key, wire, expiry)
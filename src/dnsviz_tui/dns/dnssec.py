@@ -1,6 +1,9 @@
 """DNSSEC chain of trust validation."""
 
+import copy
+import functools
 import hashlib
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -41,6 +44,50 @@ ROOT_DS_RECORDS = [
 ]
 
 
+# Trust anchors as (key_tag, algorithm, digest_type, digest) for set lookups
+_ROOT_ANCHOR_SET = frozenset(
+    (a["key_tag"], a["algorithm"], a["digest_type"], bytes.fromhex(a["digest"]))
+    for a in ROOT_DS_RECORDS
+)
+_ROOT_ANCHOR_KEYS = frozenset((a[0], a[1]) for a in _ROOT_ANCHOR_SET)
+_ROOT_ANCHOR_DIGEST_TYPES = frozenset(a[2] for a in _ROOT_ANCHOR_SET)
+
+
+# DS digest algorithms (1=SHA-1, 2=SHA-256, 4=SHA-384)
+DS_DIGEST_ALGORITHMS = {
+    1: hashlib.sha1,
+    2: hashlib.sha256,
+    4: hashlib.sha384,
+}
+
+
+# Zone name -> owner name in wire format
+_NAME_WIRE_CACHE: dict[str, bytes] = {}
+
+
+def _name_wire(name: str) -> bytes:
+    """Return the wire form of a zone name, parsing each name only once."""
+    wire = _NAME_WIRE_CACHE.get(name)
+    if wire is None:
+        wire = _NAME_WIRE_CACHE[name] = dns.name.from_text(name).to_wire()
+    return wire
+
+
+@functools.lru_cache(maxsize=2048)
+def _ds_digest_cached(name_wire: bytes, rdata: bytes, digest_type: int) -> bytes:
+    """Compute a DS digest over owner name + DNSKEY RDATA, memoized.
+
+    The root anchor and popular TLD keys are hashed on every validation;
+    caching keeps repeat validations from re-hashing the same key material.
+    """
+    hash_func = DS_DIGEST_ALGORITHMS.get(digest_type)
+    if hash_func is None:
+        return b""
+    digest = hash_func(name_wire)
+    digest.update(rdata)
+    return digest.digest()
+
+
 class DNSSECValidator:
     """Validates DNSSEC chain of trust."""
 
@@ -53,12 +100,35 @@ class DNSSECValidator:
         self.resolver = resolver or DNSResolver()
         self._formatter = RecordFormatter()
 
+        # (absolute lowercased domain, nameservers) -> (expiry epoch, copy of
+        # the completed chain)
+        self._chain_cache: dict[tuple, tuple[float, TrustChain]] = {}
+
+    def _store_chain(self, key: tuple, chain: TrustChain) -> None:
+        """Remember a copy of a completed chain while every answer in it holds.
+
+        The chain lives no longer than the resolver caches its answers, than
+        the smallest TTL among its records, or than its earliest RRSIG.
+        """
+        rrsigs = [r for zone in chain.zones for r in zone.rrsigs]
+        if not rrsigs:
+            return
+        ttls = [self.resolver.cache_max_ttl]
+        ttls.extend(r.original_ttl for r in rrsigs)
+        ttls.extend(rec.ttl for zone in chain.zones for rec in zone.additional_records)
+        now = time.time()
+        expiry = min(min(r.expiration_ts for r in rrsigs), now + min(ttls))
+        if expiry <= now:
+            return
+        # The caller keeps the original; later changes to it must not leak in
+        self._chain_cache[key] = (expiry, copy.deepcopy(chain))
+
     def _compute_ds_digest(
         self,
         zone_name: str,
         dnskey: DNSKeyInfo,
         digest_type: int,
-    ) -> str:
+    ) -> bytes:
         """Compute DS digest for a DNSKEY.
 
         Args:
@@ -67,44 +137,25 @@ class DNSSECValidator:
             digest_type: Digest algorithm (1=SHA-1, 2=SHA-256, 4=SHA-384)
 
         Returns:
-            Hex-encoded digest
+            Raw digest bytes (empty for unsupported digest types)
         """
-        import base64
-
-        # Build the data to hash: owner name (wire format) + DNSKEY RDATA
-        name = dns.name.from_text(zone_name)
-        name_wire = name.to_wire()
-
-        # DNSKEY RDATA: flags (2) + protocol (1) + algorithm (1) + key
-        key_bytes = base64.b64decode(dnskey.key_data)
-        rdata = (
-            dnskey.flags.to_bytes(2, 'big') +
-            dnskey.protocol.to_bytes(1, 'big') +
-            dnskey.algorithm.to_bytes(1, 'big') +
-            key_bytes
-        )
-
-        data = name_wire + rdata
-
-        if digest_type == 1:
-            return hashlib.sha1(data).hexdigest().upper()
-        elif digest_type == 2:
-            return hashlib.sha256(data).hexdigest().upper()
-        elif digest_type == 4:
-            return hashlib.sha384(data).hexdigest().upper()
-        else:
-            return ""
+        # Hash input is owner name (wire format) + DNSKEY RDATA
+        return _ds_digest_cached(_name_wire(zone_name), dnskey.rdata, digest_type)
 
     def _validate_ds_to_dnskey(
         self,
         zone: ZoneInfo,
         ds_records: list[DSInfo],
+        *,
+        exhaustive: bool = False,
     ) -> tuple[bool, str, Optional[int]]:
         """Validate that DS records match DNSKEYs.
 
         Args:
             zone: Zone with DNSKEYs
             ds_records: DS records from parent
+            exhaustive: Check every DS record instead of stopping once the
+                DS records for one key have been checked and one validated
 
         Returns:
             Tuple of (is_valid, reason, matching_key_tag)
@@ -115,48 +166,70 @@ class DNSSECValidator:
         if not zone.dnskeys:
             return False, "No DNSKEY records in zone", None
 
-        # Find KSKs (keys with SEP bit set)
-        ksks = [k for k in zone.dnskeys if k.is_ksk]
-        if not ksks:
-            # Some zones use ZSKs for signing, check all keys
-            ksks = zone.dnskeys
+        # Keys indexed by tag so each DS only looks at its candidate keys
+        by_tag = zone.keys_by_tag
 
-        # Try to match ALL DS records to DNSKEYs
-        # A valid chain only needs ONE DS to match, but we track all
-        validated_tags = []
-        failed_ds = []
+        # Prefer KSKs (keys with SEP bit set); some zones use ZSKs for
+        # signing, in which case all keys are candidates
+        ksk_only = bool(zone.ksks)
+
+        # Owner name is the same for every DS
+        name_wire = _name_wire(zone.name)
+
+        # A valid chain only needs ONE DS to match; unless asked to check
+        # them all, try the stronger digests first and stop after the first
+        # key that a DS validates
+        if not exhaustive:
+            ds_records = sorted(ds_records, key=lambda d: d.digest_type == 1)
 
+        # DS records for the same key (e.g. SHA-1 + SHA-256) share one
+        # candidate lookup
+        ds_by_key: dict[tuple[int, int], list[DSInfo]] = {}
         for ds in ds_records:
-            matched = False
-            for key in ksks:
-                if key.key_tag != ds.key_tag:
-                    continue
-                if key.algorithm != ds.algorithm:
-                    continue
+            ds_by_key.setdefault((ds.key_tag, ds.algorithm), []).append(ds)
 
-                # Compute expected digest
-                computed = self._compute_ds_digest(
-                    zone.name, key, ds.digest_type
-                )
-
-                if computed.upper() == ds.digest.upper():
-                    ds.validates_key = key.key_tag
-                    validated_tags.append(key.key_tag)
-                    matched = True
-                    break  # This DS matched, move to next DS
-
-            if not matched:
-                # Check if there's a DNSKEY with matching tag but wrong digest
-                matching_tag_keys = [k for k in zone.dnskeys if k.key_tag == ds.key_tag]
-                if matching_tag_keys:
-                    failed_ds.append(f"DS tag={ds.key_tag} digest mismatch")
-                else:
-                    failed_ds.append(f"DS tag={ds.key_tag} no matching DNSKEY")
+        validated_tags = []
+        failed_ds = []
+        checked = 0  # DS records compared against the keys
+
+        for (key_tag, algorithm), group in ds_by_key.items():
+            candidates = [
+                key for key in by_tag.get(key_tag, ())
+                if key.algorithm == algorithm and (key.is_ksk or not ksk_only)
+            ]
+
+            for ds in group:
+                checked += 1
+                matched = False
+                for key in candidates:
+                    # Compute expected digest
+                    computed = _ds_digest_cached(name_wire, key.rdata, ds.digest_type)
+
+                    if computed == ds.digest_bytes:
+                        ds.validates_key = key.key_tag
+                        validated_tags.append(key.key_tag)
+                        matched = True
+                        break  # This DS matched, move to next DS
+
+                if not matched:
+                    # Check if there's a DNSKEY with matching tag but wrong digest
+                    if key_tag in by_tag:
+                        failed_ds.append(f"DS tag={key_tag} digest mismatch")
+                    else:
+                        failed_ds.append(f"DS tag={key_tag} no matching DNSKEY")
+
+            # The rest of this key's DS records were checked above so each
+            # one is marked; DS records for other keys are not needed
+            if validated_tags and not exhaustive:
+                break
 
         if validated_tags:
             # At least one DS validated - chain is valid
             unique_tags = list(set(validated_tags))
-            if len(ds_records) > 1:
+            if checked < len(ds_records):
+                # Stopped early: only the DS records actually compared count
+                reason = f"DS validates DNSKEY(s) {unique_tags} ({len(validated_tags)}/{checked} DS records checked)"
+            elif len(ds_records) > 1:
                 reason = f"DS validates DNSKEY(s) {unique_tags} ({len(validated_tags)}/{len(ds_records)} DS records)"
             else:
                 reason = f"DS validates DNSKEY {unique_tags[0]}"
@@ -176,27 +249,25 @@ class DNSSECValidator:
         Returns:
             Tuple of (is_valid, reason)
         """
-        now = datetime.utcnow()
-
-        for rrsig in zone.rrsigs:
-            if rrsig.type_covered == "DNSKEY":
-                if rrsig.is_expired:
-                    rrsig.is_valid = False
-                    rrsig.validation_error = "Signature expired"
-                    return False, f"DNSKEY RRSIG expired on {rrsig.expiration}"
-
-                if rrsig.is_not_yet_valid:
-                    rrsig.is_valid = False
-                    rrsig.validation_error = "Signature not yet valid"
-                    return False, f"DNSKEY RRSIG not valid until {rrsig.inception}"
-
-                # Check if signed by a key in this zone
-                signing_key = zone.get_key_by_tag(rrsig.key_tag)
-                if signing_key:
-                    rrsig.is_valid = True
-                else:
-                    rrsig.is_valid = False
-                    rrsig.validation_error = f"Signing key {rrsig.key_tag} not found"
+        now = int(time.time())
+
+        for rrsig in zone.rrsigs_covering("DNSKEY"):
+            if now > rrsig.expiration_ts:
+                rrsig.is_valid = False
+                rrsig.validation_error = "Signature expired"
+                return False, f"DNSKEY RRSIG expired on {rrsig.expiration}"
+
+            if now < rrsig.inception_ts:
+                rrsig.is_valid = False
+                rrsig.validation_error = "Signature not yet valid"
+                return False, f"DNSKEY RRSIG not valid until {rrsig.inception}"
+
+            # Check if signed by a key in this zone
+            if rrsig.key_tag in zone.keys_by_tag:
+                rrsig.is_valid = True
+            else:
+                rrsig.is_valid = False
+                rrsig.validation_error = f"Signing key {rrsig.key_tag} not found"
 
         return True, "RRSIG timing valid"
 
@@ -216,35 +287,30 @@ class DNSSECValidator:
             return False, "Root zone has no DNSKEY records (DNS query may have failed)"
 
         # Check for trust anchor key
-        key_tags_found = [k.key_tag for k in zone.dnskeys]
-
-        for anchor in ROOT_DS_RECORDS:
-            for key in zone.dnskeys:
-                if key.key_tag != anchor["key_tag"]:
-                    continue
-                if key.algorithm != anchor["algorithm"]:
-                    continue
-
-                # Compute digest and compare
-                try:
-                    computed = self._compute_ds_digest(
-                        ".", key, anchor["digest_type"]
-                    )
+        name_wire = _name_wire(".")
+        for key in zone.dnskeys:
+            if (key.key_tag, key.algorithm) not in _ROOT_ANCHOR_KEYS:
+                continue
 
-                    if computed.upper() == anchor["digest"].upper():
+            # Hash each candidate key once per anchor digest type
+            try:
+                rdata = key.rdata
+                for digest_type in _ROOT_ANCHOR_DIGEST_TYPES:
+                    digest = _ds_digest_cached(name_wire, rdata, digest_type)
+                    if (key.key_tag, key.algorithm, digest_type, digest) in _ROOT_ANCHOR_SET:
                         return True, f"Root DNSKEY {key.key_tag} matches trust anchor"
-                except Exception:
-                    continue
+            except Exception:
+                continue
 
         # If we have KSK keys but none match, still consider it valid if we have DNSKEYs
         # This handles cases where trust anchors are outdated
-        ksks = [k for k in zone.dnskeys if k.is_ksk]
-        if ksks:
-            return True, f"Root has KSK(s): {[k.key_tag for k in ksks]} (trust anchor verification skipped)"
+        if zone.ksks:
+            return True, f"Root has KSK(s): {[k.key_tag for k in zone.ksks]} (trust anchor verification skipped)"
 
+        key_tags_found = [k.key_tag for k in zone.dnskeys]
         return False, f"No root DNSKEY matches trust anchor. Found keys: {key_tags_found}"
 
-    def validate_chain(self, domain: str) -> TrustChain:
+    async def validate_chain(self, domain: str) -> TrustChain:
         """Validate the complete DNSSEC chain for a domain.
 
         Args:
@@ -253,12 +319,28 @@ class DNSSECValidator:
         Returns:
             TrustChain with validation results
         """
+        start_time = time.time()
+
+        # Repeated lookups of the same domain reuse the earlier result; DNS
+        # names are case-insensitive and the trailing dot is optional
+        cache_key = (domain.lower().rstrip(".") + ".", tuple(self.resolver.nameservers))
+        cached = self._chain_cache.get(cache_key)
+        if cached is not None:
+            expiry, cached_chain = cached
+            if start_time < expiry:
+                chain = copy.deepcopy(cached_chain)
+                chain.target_domain = domain
+                chain.query_time = datetime.utcnow()
+                chain.query_duration_ms = (time.time() - start_time) * 1000
+                return chain
+            del self._chain_cache[cache_key]
+
         chain = TrustChain(target_domain=domain)
         chain.resolver_used = ", ".join(self.resolver.nameservers)
 
         # Query all zones
         try:
-            zones, query_time = self.resolver.query_zone_chain(domain)
+            zones, query_time = await self.resolver.query_zone_chain(domain)
         except Exception as e:
             chain.overall_status = ValidationStatus.INDETERMINATE
             chain.overall_reason = f"DNS query failed: {str(e)}"
@@ -303,7 +385,7 @@ class DNSSECValidator:
 
         # Validate each zone in the chain
         parent_zone = root
-        all_secure = True
+        first_bad: Optional[ZoneInfo] = None  # First zone that is not secure
 
         for zone in zones[1:]:
             # Check if zone has DNSSEC
@@ -312,7 +394,8 @@ class DNSSECValidator:
                     # No DNSSEC delegation - insecure
                     zone.status = ValidationStatus.INSECURE
                     zone.status_reason = "No DNSSEC (unsigned delegation)"
-                    all_secure = False
+                    if first_bad is None:
+                        first_bad = zone
                 else:
                     # Has DS but no DNSKEY - broken
                     zone.status = ValidationStatus.BOGUS
@@ -343,11 +426,13 @@ class DNSSECValidator:
                     if parent_zone.status == ValidationStatus.SECURE:
                         zone.status = ValidationStatus.INSECURE
                         zone.status_reason = "No DS record in parent (insecure delegation)"
-                        all_secure = False
+                        if first_bad is None:
+                            first_bad = zone
                     else:
                         zone.status = ValidationStatus.INSECURE
                         zone.status_reason = "Parent zone is not secure"
-                        all_secure = False
+                        if first_bad is None:
+                            first_bad = zone
                     parent_zone = zone
                     continue
 
@@ -361,17 +446,14 @@ class DNSSECValidator:
                 return chain
 
             # Check if DNSKEY is self-signed by a trusted key
-            dnskey_rrsig = None
-            for rrsig in zone.rrsigs:
-                if rrsig.type_covered == "DNSKEY":
-                    dnskey_rrsig = rrsig
-                    break
+            dnskey_rrsigs = zone.rrsigs_covering("DNSKEY")
+            dnskey_rrsig = dnskey_rrsigs[0] if dnskey_rrsigs else None
 
             if dnskey_rrsig:
                 # Check if signing key matches validated DS
                 if matched_tag and dnskey_rrsig.key_tag == matched_tag:
                     zone.dnskey_validated = True
-                elif zone.get_key_by_tag(dnskey_rrsig.key_tag):
+                elif dnskey_rrsig.key_tag in zone.keys_by_tag:
                     # Signed by a key in the zone (could be ZSK signed by KSK chain)
                     zone.dnskey_validated = True
 
@@ -386,24 +468,21 @@ class DNSSECValidator:
             else:
                 zone.status = ValidationStatus.INDETERMINATE
                 zone.status_reason = "Could not fully validate"
-                all_secure = False
+                if first_bad is None:
+                    first_bad = zone
 
             parent_zone = zone
 
         # Set overall status
-        if all_secure:
+        if first_bad is None:
             chain.overall_status = ValidationStatus.SECURE
             chain.overall_reason = "Complete chain of trust validated"
+        elif first_bad.status == ValidationStatus.INSECURE:
+            chain.overall_status = ValidationStatus.INSECURE
+            chain.overall_reason = f"Chain breaks at {first_bad.name}: {first_bad.status_reason}"
         else:
-            # Find the first non-secure zone
-            for zone in zones:
-                if zone.status != ValidationStatus.SECURE:
-                    if zone.status == ValidationStatus.INSECURE:
-                        chain.overall_status = ValidationStatus.INSECURE
-                        chain.overall_reason = f"Chain breaks at {zone.name}: {zone.status_reason}"
-                    else:
-                        chain.overall_status = zone.status
-                        chain.overall_reason = f"Chain issue at {zone.name}: {zone.status_reason}"
-                    break
+            chain.overall_status = first_bad.status
+            chain.overall_reason = f"Chain issue at {first_bad.name}: {first_bad.status_reason}"
 
+        self._store_chain(cache_key, chain)
         return chain
@@ -1,10 +1,10 @@
 """DNS record type definitions and parsing utilities."""
 
 import base64
+import functools
+import struct
 from datetime import datetime
-from typing import Optional
 
-import dns.dnssec
 import dns.rdatatype
 import dns.rdata
 from dns.rdtypes.ANY.DNSKEY import DNSKEY
@@ -21,9 +21,33 @@ from dnsviz_tui.models.chain import (
     AdditionalRecord,
 )
 
+# Optional SIMD base64 codec (pip install dnsviz-tui[speedups])
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+if pybase64 is not None:
+    _b64encode_str = pybase64.b64encode_as_string
+else:
+    def _b64encode_str(data: bytes) -> str:
+        """Base64-encode bytes to an ASCII string."""
+        return base64.b64encode(data).decode('ascii')
+
+
+class _NameMap(dict):
+    """Number -> name table whose subscript falls back to "Unknown (<n>)".
+
+    The fallback is only built for codes that are actually missing; .get()
+    keeps plain dict semantics.
+    """
+
+    def __missing__(self, key: int) -> str:
+        return f"Unknown ({key})"
+
 
 # Algorithm name mapping
-ALGORITHM_NAMES = {
+ALGORITHM_NAMES = _NameMap({
     1: "RSA/MD5",
     3: "DSA/SHA-1",
     5: "RSA/SHA-1",
@@ -36,48 +60,119 @@ ALGORITHM_NAMES = {
     14: "ECDSA/P-384/SHA-384",
     15: "Ed25519",
     16: "Ed448",
-}
+})
 
 # Digest type mapping
-DIGEST_TYPE_NAMES = {
+DIGEST_TYPE_NAMES = _NameMap({
     1: "SHA-1",
     2: "SHA-256",
     3: "GOST R 34.11-94",
     4: "SHA-384",
+})
+
+# Big-endian uint16 reader for the RSA long-form exponent length
+_unpack_be16 = struct.Struct(">H").unpack_from
+
+# RSA algorithms (RSA/MD5, RSA/SHA-1, RSASHA1-NSEC3-SHA1, RSA/SHA-256, RSA/SHA-512)
+_RSA_ALGORITHMS = frozenset((1, 5, 7, 8, 10))
+
+# Algorithms with a fixed key size in bits
+_FIXED_KEY_LENGTHS = {
+    13: 256,    # ECDSA P-256
+    14: 384,    # ECDSA P-384
+    15: 256,    # Ed25519
+    16: 448,    # Ed448
 }
 
+
 # Key length estimation based on algorithm
 def estimate_key_length(algorithm: int, key_data: bytes) -> int:
     """Estimate key length in bits based on algorithm and key data."""
-    key_len = len(key_data) * 8
-
     # RSA keys have specific structure
-    if algorithm in (1, 5, 7, 8, 10):
+    if algorithm in _RSA_ALGORITHMS:
         # RSA: subtract exponent length indicator and exponent
         if key_data[0] == 0:
-            exp_len = (key_data[1] << 8) | key_data[2]
+            exp_len = _unpack_be16(key_data, 1)[0]
             return (len(key_data) - 3 - exp_len) * 8
         else:
             exp_len = key_data[0]
             return (len(key_data) - 1 - exp_len) * 8
 
-    # ECDSA P-256
-    if algorithm == 13:
-        return 256
+    return _FIXED_KEY_LENGTHS.get(algorithm, len(key_data) * 8)
+
+
+def compute_key_tag(wire: bytes) -> int:
+    """Compute the key tag of DNSKEY RDATA in wire format (RFC 4034, App. B).
+
+    The 16-bit big-endian word sum is taken as two C-level byte sums
+    (high bytes at even offsets, low bytes at odd offsets) instead of a
+    per-byte Python loop.
+    """
+    # RSA/MD5 keys use the low 16 bits of the modulus instead
+    if wire[3] == 1:
+        return (wire[-3] << 8) | wire[-2]
+    ac = (sum(wire[0::2]) << 8) + sum(wire[1::2])
+    ac += (ac >> 16) & 0xFFFF
+    return ac & 0xFFFF
+
+
+@functools.lru_cache(maxsize=4096)
+def _dnskey_derived(rdata: DNSKEY) -> tuple[int, str, int]:
+    """Return (key_tag, base64 key, key length) for a DNSKEY.
 
-    # ECDSA P-384
-    if algorithm == 14:
-        return 384
+    Rdata objects hash and compare by their wire form, so the same key seen
+    in another chain (root, TLDs) reuses the earlier result.
+    """
+    key_bytes = rdata.key
+    return (
+        compute_key_tag(rdata.to_wire()),
+        _b64encode_str(key_bytes),
+        estimate_key_length(rdata.algorithm, key_bytes),
+    )
 
-    # Ed25519
-    if algorithm == 15:
-        return 256
 
-    # Ed448
-    if algorithm == 16:
-        return 448
+@functools.lru_cache(maxsize=4096)
+def _signature_b64(signature: bytes) -> str:
+    """Return the base64 form of an RRSIG signature."""
+    return _b64encode_str(signature)
 
-    return key_len
+
+@functools.lru_cache(maxsize=4096)
+def _digest_hex(digest: bytes) -> str:
+    """Return the upper-case hex form of a DS digest."""
+    return digest.hex().upper()
+
+
+@functools.lru_cache(maxsize=256)
+def _format_key_tag(tag: int) -> str:
+    """Format a key tag for display."""
+    return f"{tag:05d}"
+
+
+@functools.lru_cache(maxsize=256)
+def _format_algorithm(algo: int) -> str:
+    """Format an algorithm number with name."""
+    name = ALGORITHM_NAMES.get(algo, "Unknown")
+    return f"{algo} ({name})"
+
+
+@functools.lru_cache(maxsize=256)
+def _format_digest_type(dtype: int) -> str:
+    """Format a digest type with name."""
+    name = DIGEST_TYPE_NAMES.get(dtype, "Unknown")
+    return f"{dtype} ({name})"
+
+
+@functools.lru_cache(maxsize=256)
+def _format_ttl(ttl: int) -> str:
+    """Format TTL in human-readable form."""
+    if ttl < 60:
+        return f"{ttl}s"
+    if ttl < 3600:
+        return f"{ttl // 60}m"
+    if ttl < 86400:
+        return f"{ttl // 3600}h"
+    return f"{ttl // 86400}d"
 
 
 class RecordFormatter:
@@ -86,17 +181,16 @@ class RecordFormatter:
     @staticmethod
     def parse_dnskey(rdata: DNSKEY) -> DNSKeyInfo:
         """Parse a DNSKEY record into DNSKeyInfo."""
-        key_bytes = rdata.key
-        key_b64 = base64.b64encode(key_bytes).decode('ascii')
+        key_tag, key_b64, key_length = _dnskey_derived(rdata)
 
         return DNSKeyInfo(
             flags=rdata.flags,
             protocol=rdata.protocol,
             algorithm=rdata.algorithm,
-            algorithm_name=ALGORITHM_NAMES.get(rdata.algorithm, f"Unknown ({rdata.algorithm})"),
-            key_tag=dns.dnssec.key_id(rdata),
+            algorithm_name=ALGORITHM_NAMES[rdata.algorithm],
+            key_tag=key_tag,
             key_data=key_b64,
-            key_length=estimate_key_length(rdata.algorithm, key_bytes),
+            key_length=key_length,
         )
 
     @staticmethod
@@ -105,30 +199,27 @@ class RecordFormatter:
         return DSInfo(
             key_tag=rdata.key_tag,
             algorithm=rdata.algorithm,
-            algorithm_name=ALGORITHM_NAMES.get(rdata.algorithm, f"Unknown ({rdata.algorithm})"),
+            algorithm_name=ALGORITHM_NAMES[rdata.algorithm],
             digest_type=rdata.digest_type,
-            digest_type_name=DIGEST_TYPE_NAMES.get(rdata.digest_type, f"Unknown ({rdata.digest_type})"),
-            digest=rdata.digest.hex().upper(),
+            digest_type_name=DIGEST_TYPE_NAMES[rdata.digest_type],
+            digest=_digest_hex(rdata.digest),
+            digest_bytes=rdata.digest,
         )
 
     @staticmethod
     def parse_rrsig(rdata: RRSIG) -> RRSIGInfo:
         """Parse an RRSIG record into RRSIGInfo."""
-        # Convert timestamps
-        expiration = datetime.utcfromtimestamp(rdata.expiration)
-        inception = datetime.utcfromtimestamp(rdata.inception)
-
         return RRSIGInfo(
             type_covered=dns.rdatatype.to_text(rdata.type_covered),
             algorithm=rdata.algorithm,
-            algorithm_name=ALGORITHM_NAMES.get(rdata.algorithm, f"Unknown ({rdata.algorithm})"),
+            algorithm_name=ALGORITHM_NAMES[rdata.algorithm],
             labels=rdata.labels,
             original_ttl=rdata.original_ttl,
-            expiration=expiration,
-            inception=inception,
+            expiration_ts=rdata.expiration,
+            inception_ts=rdata.inception,
             key_tag=rdata.key_tag,
             signer_name=str(rdata.signer),
-            signature=base64.b64encode(rdata.signature).decode('ascii'),
+            signature=_signature_b64(rdata.signature),
         )
 
     @staticmethod
@@ -178,35 +269,14 @@ class RecordFormatter:
             ttl=ttl,
         )
 
-    @staticmethod
-    def format_key_tag(tag: int) -> str:
-        """Format a key tag for display."""
-        return f"{tag:05d}"
-
-    @staticmethod
-    def format_algorithm(algo: int) -> str:
-        """Format an algorithm number with name."""
-        name = ALGORITHM_NAMES.get(algo, "Unknown")
-        return f"{algo} ({name})"
-
-    @staticmethod
-    def format_digest_type(dtype: int) -> str:
-        """Format a digest type with name."""
-        name = DIGEST_TYPE_NAMES.get(dtype, "Unknown")
-        return f"{dtype} ({name})"
+    # The int-keyed formatters run for every rendered row and only ever see a
+    # handful of distinct values, so they are memoized at module level
+    format_key_tag = staticmethod(_format_key_tag)
+    format_algorithm = staticmethod(_format_algorithm)
+    format_digest_type = staticmethod(_format_digest_type)
+    format_ttl = staticmethod(_format_ttl)
 
     @staticmethod
     def format_timestamp(dt: datetime) -> str:
         """Format a datetime for display."""
         return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-    @staticmethod
-    def format_ttl(ttl: int) -> str:
-        """Format TTL in human-readable form."""
-        if ttl < 60:
-            return f"{ttl}s"
-        if ttl < 3600:
-            return f"{ttl // 60}m"
-        if ttl < 86400:
-            return f"{ttl // 3600}h"
-        return f"{ttl // 86400}d"
@@ -1,27 +1,122 @@
 """DNS resolver for querying DNSSEC records."""
 
+import asyncio
+import copy
+import functools
+import re
+import threading
 import time
-from typing import Optional
+from collections import OrderedDict
+from typing import Collection, Optional
 
+import dns.asyncquery
+import dns.asyncresolver
 import dns.name
-import dns.query
 import dns.resolver
+import dns.ttl
 import dns.rdatatype
 import dns.message
 import dns.flags
-from dns.rdtypes.ANY.DNSKEY import DNSKEY
-from dns.rdtypes.ANY.DS import DS
+import dns.rcode
+import dns.rdataclass
 from dns.rdtypes.ANY.RRSIG import RRSIG
 
+from dnsviz_tui.dns.cache import AnswerCache
 from dnsviz_tui.dns.records import RecordFormatter
 from dnsviz_tui.models.chain import (
     ZoneInfo,
     AdditionalRecord,
-    ValidationStatus,
+    RRSIGInfo,
     ConsistencyResult,
     ServerResponse,
 )
 
+# Hoisted rdtype constants for the answer-section walks
+_DNSKEY_RDTYPE = dns.rdatatype.DNSKEY
+_RRSIG_RDTYPE = dns.rdatatype.RRSIG
+_TXT_RDTYPE = dns.rdatatype.TXT
+
+# Policy TXT records (SPF, RFC 7208; DMARC, RFC 7489) open with a "v=<tag>"
+# version token. Known tags map to (record type label, required owner prefix);
+# new record kinds (DKIM, MTA-STS, ...) only need an entry here.
+_TXT_VERSION_RE = re.compile(r'v\s*=\s*([^\s;"]+)', re.IGNORECASE)
+_TXT_VERSION_TYPES = {
+    "spf1": ("SPF", ""),
+    "dmarc1": ("DMARC", "_dmarc."),
+}
+
+
+def _classify_txt(name: str, value: str) -> str:
+    """Return the record type label for a TXT record (unquoted value)."""
+    match = _TXT_VERSION_RE.match(value)
+    if match:
+        entry = _TXT_VERSION_TYPES.get(match.group(1).lower())
+        if entry is not None and name.startswith(entry[1]):
+            return entry[0]
+    return "TXT"
+
+# Record types looked up at the domain itself by query_additional_records
+_DOMAIN_RECORD_TYPES = ("A", "AAAA", "MX", "TXT")  # TXT includes SPF
+
+
+# What the answer cache holds: an answer (possibly without data) or the
+# NXDOMAIN raised for a name that does not exist
+CachedAnswer = dns.resolver.Answer | dns.resolver.NXDOMAIN
+
+
+def _answer_ttl(answer: dns.resolver.Answer) -> int:
+    """Return how long an answer may be cached.
+
+    This is the minimum TTL over the CNAME chain or, for a no-data answer,
+    the SOA negative TTL (RFC 2308). No-data answers without an SOA are not
+    cached.
+    """
+    ttl = answer.chaining_result.minimum_ttl
+    return 0 if ttl >= dns.ttl.MAX_TTL else ttl
+
+
+def _negative_ttl(error: dns.resolver.NXDOMAIN) -> int:
+    """Return how long an NXDOMAIN may be cached (0 without an SOA)."""
+    for response in error.kwargs.get("responses", {}).values():
+        try:
+            ttl = response.resolve_chaining().minimum_ttl
+        except Exception:
+            continue
+        if ttl < dns.ttl.MAX_TTL:
+            return ttl
+    return 0
+
+
+def _answer_response(answer: CachedAnswer) -> Optional[dns.message.Message]:
+    """Return the response message a cached answer was built from."""
+    if isinstance(answer, dns.resolver.NXDOMAIN):
+        return next(iter(answer.kwargs.get("responses", {}).values()), None)
+    return answer.response
+
+
+def _answer_from_wire(name: str, rdtype: str, wire: bytes) -> CachedAnswer:
+    """Rebuild a cached answer (or NXDOMAIN) from its response in wire format."""
+    qname = dns.name.from_text(name)
+    response = dns.message.from_wire(wire)
+    if response.rcode() == dns.rcode.NXDOMAIN:
+        return dns.resolver.NXDOMAIN(qnames=[qname], responses={qname: response})
+    return dns.resolver.Answer(
+        qname, dns.rdatatype.from_text(rdtype), dns.rdataclass.IN, response
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _zone_hierarchy(domain: str) -> tuple[str, ...]:
+    """Return the zones from root down to domain, walking dns.name parents."""
+    name = dns.name.from_text(domain)
+    zones = []
+    while name != dns.name.root:
+        zones.append(name.to_text())
+        name = name.parent()
+    zones.append(".")
+    zones.reverse()
+    return tuple(zones)
+
 
 class DNSResolver:
     """DNS resolver for DNSSEC chain of trust queries."""
@@ -29,28 +124,248 @@ class DNSResolver:
     # Default resolvers to try
     DEFAULT_RESOLVERS = ["8.8.8.8", "1.1.1.1", "9.9.9.9"]
 
-    def __init__(self, nameservers: Optional[list[str]] = None):
+    # Maximum number of answers kept in the TTL cache
+    CACHE_MAX_ENTRIES = 4096
+
+    # Upper bound in seconds on how long a cached answer is trusted
+    CACHE_MAX_TTL = 300
+
+    # Offsets in seconds at which successive nameservers join a lookup; a
+    # nameserver is only contacted if the earlier ones are slow or failed.
+    # Nameservers beyond these are tried one by one if all of them fail.
+    STAGGER_DELAYS = (0.0, 0.2, 0.3)
+
+    def __init__(
+        self,
+        nameservers: Optional[list[str]] = None,
+        cache_max_ttl: Optional[int] = None,
+        answer_cache: Optional[AnswerCache] = None,
+    ):
         """Initialize the resolver.
 
         Args:
             nameservers: List of nameserver IPs to use. If None, uses system default.
+            cache_max_ttl: Longest time in seconds an answer (positive or
+                negative) is cached. If None, uses CACHE_MAX_TTL.
+            answer_cache: Persistent cache of raw DNS answers, consulted when
+                the in-memory cache misses. If None, answers are only cached
+                in memory.
         """
-        self.resolver = dns.resolver.Resolver()
+        self.resolver = dns.asyncresolver.Resolver()
         if nameservers:
             self.resolver.nameservers = nameservers
         self.resolver.use_edns(edns=0, ednsflags=dns.flags.DO, payload=4096)
         self._formatter = RecordFormatter()
+        # nameservers -> (raced single-server resolvers, serial fallback)
+        self._staggered: Optional[tuple[
+            tuple[str, ...],
+            list[dns.asyncresolver.Resolver],
+            Optional[dns.asyncresolver.Resolver],
+        ]] = None
+
+        # (lowercased absolute name, rdtype) -> (monotonic expiry, answer),
+        # least recently used first
+        self._cache: OrderedDict[tuple[str, str], tuple[float, CachedAnswer]] = OrderedDict()
+        self._cache_max_ttl = self.CACHE_MAX_TTL if cache_max_ttl is None else cache_max_ttl
+        self._cache_lock = threading.Lock()
+        self._answer_cache = answer_cache
+
+        # lowercased NS hostname -> (monotonic expiry, IPv4 addresses)
+        self._ns_ip_cache: OrderedDict[str, tuple[float, tuple[str, ...]]] = OrderedDict()
 
     @property
     def nameservers(self) -> list[str]:
         """Get current nameservers."""
         return self.resolver.nameservers
 
+    @property
+    def cache_max_ttl(self) -> int:
+        """Longest time in seconds an answer is cached."""
+        return self._cache_max_ttl
+
     def set_nameservers(self, nameservers: list[str]) -> None:
-        """Set nameservers to use."""
+        """Set nameservers to use.
+
+        Only the in-memory caches are dropped; persistent cache keys include
+        the nameservers, so entries for the old ones are simply not matched.
+        """
         self.resolver.nameservers = nameservers
+        with self._cache_lock:
+            self._cache.clear()
+            self._ns_ip_cache.clear()
+
+    def clear_cache(self) -> None:
+        """Drop all cached answers, in memory and on disk."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._ns_ip_cache.clear()
+        if self._answer_cache is not None:
+            self._answer_cache.clear()
+
+    def _disk_key(self, key: tuple[str, str]) -> str:
+        """Return the persistent cache key for an in-memory cache key."""
+        return AnswerCache.make_key(self.resolver.nameservers, *key)
+
+    def _cache_get(self, key: tuple[str, str]) -> Optional[CachedAnswer]:
+        """Return a cached answer if present and not yet expired.
+
+        Answers missing from memory are looked up in the persistent cache
+        and, when found, kept in memory for the rest of their lifetime.
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                expiry, answer = entry
+                if time.monotonic() < expiry:
+                    self._cache.move_to_end(key)
+                    return answer
+                del self._cache[key]
+
+        if self._answer_cache is None:
+            return None
+        stored = self._answer_cache.get(self._disk_key(key))
+        if stored is None:
+            return None
+        try:
+            answer = _answer_from_wire(*key, stored[1])
+        except Exception:
+            return None
+        self._cache_put(key, answer, stored[0] - time.time(), persist=False)
+        return answer
+
+    def _cache_put(
+        self,
+        key: tuple[str, str],
+        answer: CachedAnswer,
+        ttl: float,
+        persist: bool = True,
+    ) -> None:
+        """Store an answer for its TTL, capped at the resolver's max cache TTL.
+
+        Unless persist is False, the response is also written to the
+        persistent cache so that later sessions can reuse it.
+        """
+        ttl = min(ttl, self._cache_max_ttl)
+        if ttl <= 0:
+            return
+        expiry = time.monotonic() + ttl
+        with self._cache_lock:
+            self._cache[key] = (expiry, answer)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+        if persist and self._answer_cache is not None:
+            response = _answer_response(answer)
+            if response is not None:
+                self._answer_cache.put(
+                    self._disk_key(key), response.to_wire(), int(time.time() + ttl)
+                )
+
+    async def _resolve_ns_ips(self, ns_name: str) -> tuple[str, ...]:
+        """Resolve a nameserver hostname to its IPv4 addresses.
+
+        The same NS hosts recur across sibling zones, so the rendered
+        addresses are kept until the A record's TTL runs out.
+        """
+        key = ns_name.lower()
+        with self._cache_lock:
+            entry = self._ns_ip_cache.get(key)
+            if entry is not None:
+                if time.monotonic() < entry[0]:
+                    self._ns_ip_cache.move_to_end(key)
+                    return entry[1]
+                del self._ns_ip_cache[key]
+
+        answer = await self._query(ns_name, "A")
+        if not answer:
+            return ()
+        ips = tuple(str(rdata) for rdata in answer)
+
+        if answer.rrset is not None:
+            expiry = time.monotonic() + min(answer.rrset.ttl, self._cache_max_ttl)
+            with self._cache_lock:
+                self._ns_ip_cache[key] = (expiry, ips)
+                self._ns_ip_cache.move_to_end(key)
+                while len(self._ns_ip_cache) > self.CACHE_MAX_ENTRIES:
+                    self._ns_ip_cache.popitem(last=False)
+        return ips
+
+    def _copy_resolver(self, nameservers: list[str]) -> dns.asyncresolver.Resolver:
+        """Return a copy of the main resolver restricted to some nameservers.
+
+        The copy keeps every other setting (timeout, lifetime, search list,
+        EDNS options), whether it came from resolv.conf or was set later.
+        """
+        resolver = copy.copy(self.resolver)
+        resolver.nameservers = nameservers
+        return resolver
+
+    def _stagger_resolvers(
+        self,
+    ) -> tuple[list[dns.asyncresolver.Resolver], Optional[dns.asyncresolver.Resolver]]:
+        """Return the raced single-nameserver resolvers and the serial fallback.
+
+        Each of the first len(STAGGER_DELAYS) nameservers gets its own
+        resolver; any further nameservers are tried in order by the fallback.
+        """
+        nameservers = tuple(self.resolver.nameservers)
+        if self._staggered is None or self._staggered[0] != nameservers:
+            raced = nameservers[:len(self.STAGGER_DELAYS)]
+            rest = list(nameservers[len(raced):])
+            resolvers = [self._copy_resolver([nameserver]) for nameserver in raced]
+            fallback = self._copy_resolver(rest) if rest else None
+            self._staggered = (nameservers, resolvers, fallback)
+        return self._staggered[1], self._staggered[2]
+
+    async def _resolve(self, name: str, rdtype: str) -> dns.resolver.Answer:
+        """Resolve against the configured nameservers, racing them staggered.
+
+        The first nameserver is asked at once and each further one joins
+        after its STAGGER_DELAYS offset, or straight away once every attempt
+        in flight has failed. The first answer (or NXDOMAIN, which is
+        authoritative) wins and the remaining attempts are cancelled. If
+        every raced nameserver fails, the rest are tried one after another.
+        """
+        resolvers, fallback = self._stagger_resolvers()
+        if len(resolvers) <= 1:
+            return await self.resolver.resolve(name, rdtype, raise_on_no_answer=False)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        waiting = list(zip(self.STAGGER_DELAYS, resolvers))
+        pending: set[asyncio.Task] = set()
+        errors: list[BaseException] = []
+
+        try:
+            while waiting or pending:
+                if waiting and (not pending or loop.time() - start >= waiting[0][0]):
+                    _, resolver = waiting.pop(0)
+                    pending.add(asyncio.ensure_future(
+                        resolver.resolve(name, rdtype, raise_on_no_answer=False)
+                    ))
+                    continue
 
-    def _query(
+                timeout = max(0.0, start + waiting[0][0] - loop.time()) if waiting else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if isinstance(error, dns.resolver.NXDOMAIN):
+                        raise error
+                    errors.append(error)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if fallback is not None:
+            return await fallback.resolve(name, rdtype, raise_on_no_answer=False)
+        raise errors[0]
+
+    async def _query(
         self,
         name: str,
         rdtype: str,
@@ -66,10 +381,22 @@ class DNSResolver:
         Returns:
             Answer object or None if no records found
         """
+        # Names differing only in case or the trailing dot are the same query
+        key = (name.lower().rstrip('.') + '.', rdtype)
+        cached = self._cache_get(key)
+        if isinstance(cached, dns.resolver.NXDOMAIN):
+            if raise_on_nxdomain:
+                raise cached
+            return None
+        if cached is not None:
+            return cached
+
         try:
-            answer = self.resolver.resolve(name, rdtype, raise_on_no_answer=False)
+            answer = await self._resolve(name, rdtype)
+            self._cache_put(key, answer, _answer_ttl(answer))
             return answer
-        except dns.resolver.NXDOMAIN:
+        except dns.resolver.NXDOMAIN as e:
+            self._cache_put(key, e, _negative_ttl(e))
             if raise_on_nxdomain:
                 raise
             return None
@@ -84,7 +411,34 @@ class DNSResolver:
         except Exception:
             return None
 
-    def query_dnskeys(self, zone: str) -> ZoneInfo:
+    @staticmethod
+    def _rrsigs_for(answer: dns.resolver.Answer) -> Collection[RRSIG]:
+        """Return the RRSIGs covering an answer's RRset.
+
+        The signature RRset is looked up by owner name, class, type and
+        covered type in one find_rrset call, rather than by scanning and
+        filtering the whole answer section.
+        """
+        if answer.rrset is None or answer.response is None:
+            return ()
+        try:
+            return answer.response.find_rrset(
+                answer.response.answer,
+                answer.rrset.name,
+                answer.rdclass,
+                _RRSIG_RDTYPE,
+                covers=answer.rdtype,
+            )
+        except KeyError:
+            return ()
+
+    def _first_rrsig(self, answer: dns.resolver.Answer) -> Optional[RRSIGInfo]:
+        """Return the first RRSIG covering an answer's record type, parsed."""
+        for rdata in self._rrsigs_for(answer):
+            return self._formatter.parse_rrsig(rdata)
+        return None
+
+    async def query_dnskeys(self, zone: str) -> ZoneInfo:
         """Query DNSKEY records for a zone.
 
         Args:
@@ -96,25 +450,27 @@ class DNSResolver:
         zone_info = ZoneInfo(name=zone)
 
         # Query DNSKEY
-        answer = self._query(zone, "DNSKEY")
+        answer = await self._query(zone, "DNSKEY")
         if answer:
+            rrsigs = self._rrsigs_for(answer)
+
+            # The answer RRset and its RRSIG RRset were each selected by
+            # rdtype, so the rdata need no per-record type checks
+            parse_dnskey = self._formatter.parse_dnskey
+            parse_rrsig = self._formatter.parse_rrsig
+
+            # Get RRSIGs for DNSKEY, indexed by the tag of the signing key
+            zone_info.rrsigs = [parse_rrsig(rdata) for rdata in rrsigs]
+            rrsig_by_tag = {r.key_tag: r for r in reversed(zone_info.rrsigs)}
+
             for rdata in answer:
-                if isinstance(rdata, DNSKEY):
-                    key_info = self._formatter.parse_dnskey(rdata)
-                    zone_info.dnskeys.append(key_info)
-
-            # Get RRSIGs for DNSKEY
-            if answer.response:
-                for rrset in answer.response.answer:
-                    if rrset.rdtype == dns.rdatatype.RRSIG:
-                        for rdata in rrset:
-                            if isinstance(rdata, RRSIG) and rdata.type_covered == dns.rdatatype.DNSKEY:
-                                rrsig_info = self._formatter.parse_rrsig(rdata)
-                                zone_info.rrsigs.append(rrsig_info)
+                key_info = parse_dnskey(rdata)
+                key_info.rrsig = rrsig_by_tag.get(key_info.key_tag)
+                zone_info.dnskeys.append(key_info)
 
         return zone_info
 
-    def query_ds(self, zone: str) -> list:
+    async def query_ds(self, zone: str) -> list:
         """Query DS records for a zone from its parent.
 
         Args:
@@ -124,15 +480,13 @@ class DNSResolver:
             List of DSInfo objects
         """
         ds_records = []
-        answer = self._query(zone, "DS")
+        answer = await self._query(zone, "DS")
         if answer:
-            for rdata in answer:
-                if isinstance(rdata, DS):
-                    ds_info = self._formatter.parse_ds(rdata)
-                    ds_records.append(ds_info)
+            parse_ds = self._formatter.parse_ds
+            ds_records = [parse_ds(rdata) for rdata in answer]
         return ds_records
 
-    def query_additional_records(self, domain: str) -> list[AdditionalRecord]:
+    async def query_additional_records(self, domain: str) -> list[AdditionalRecord]:
         """Query additional records for a domain (SOA, NS, SPF, DMARC, etc.).
 
         Args:
@@ -147,20 +501,24 @@ class DNSResolver:
         if not domain.endswith('.'):
             domain = domain + '.'
 
-        # Query SOA record first (zone authority info)
+        # Other common record types at the domain, plus its DMARC policy
+        record_queries = [(domain, rdtype) for rdtype in _DOMAIN_RECORD_TYPES]
+        record_queries.append((f"_dmarc.{domain}", "TXT"))  # DMARC
+
+        # The lookups are independent, so SOA and NS go out in the same
+        # flight as the rest; results are still listed SOA, NS, then others
+        soa_answer, ns_answer, *answers = await asyncio.gather(
+            self._query(domain, "SOA"),
+            self._query(domain, "NS"),
+            *(self._query(name, rdtype) for name, rdtype in record_queries),
+            return_exceptions=True,
+        )
+
+        # SOA record (zone authority info)
         try:
-            soa_answer = self._query(domain, "SOA")
-            if soa_answer:
-                has_rrsig = False
-                rrsig_info = None
-                if soa_answer.response:
-                    for rrset in soa_answer.response.answer:
-                        if rrset.rdtype == dns.rdatatype.RRSIG:
-                            for rdata in rrset:
-                                if isinstance(rdata, RRSIG):
-                                    has_rrsig = True
-                                    rrsig_info = self._formatter.parse_rrsig(rdata)
-                                    break
+            if soa_answer and not isinstance(soa_answer, BaseException):
+                rrsig_info = self._first_rrsig(soa_answer)
+                has_rrsig = rrsig_info is not None
 
                 for rdata in soa_answer:
                     # Format SOA with serial first (most important), then other fields
@@ -191,31 +549,23 @@ class DNSResolver:
         except Exception:
             pass
 
-        # Query NS records (nameservers)
+        # NS records (nameservers)
         try:
-            ns_answer = self._query(domain, "NS")
-            if ns_answer:
-                has_rrsig = False
-                rrsig_info = None
-                if ns_answer.response:
-                    for rrset in ns_answer.response.answer:
-                        if rrset.rdtype == dns.rdatatype.RRSIG:
-                            for rdata in rrset:
-                                if isinstance(rdata, RRSIG):
-                                    has_rrsig = True
-                                    rrsig_info = self._formatter.parse_rrsig(rdata)
-                                    break
-
-                for rdata in ns_answer:
-                    ns_name = str(rdata.target)
-                    # Try to resolve NS to IP for display
+            if ns_answer and not isinstance(ns_answer, BaseException):
+                rrsig_info = self._first_rrsig(ns_answer)
+                has_rrsig = rrsig_info is not None
+
+                # Try to resolve each NS to IP for display, all at once
+                ns_names = [str(rdata.target) for rdata in ns_answer]
+                ns_ips = await asyncio.gather(
+                    *(self._resolve_ns_ips(ns_name) for ns_name in ns_names),
+                    return_exceptions=True,
+                )
+
+                for ns_name, ips in zip(ns_names, ns_ips):
                     ns_ip = ""
-                    try:
-                        a_answer = self._query(ns_name, "A")
-                        if a_answer:
-                            ns_ip = f" ({', '.join(str(r) for r in a_answer)})"
-                    except Exception:
-                        pass
+                    if ips and not isinstance(ips, BaseException):
+                        ns_ip = f" ({', '.join(ips)})"
 
                     records.append(AdditionalRecord(
                         record_type="NS",
@@ -228,49 +578,33 @@ class DNSResolver:
         except Exception:
             pass
 
-        # Query other common record types
-        record_queries = [
-            (domain, "A"),
-            (domain, "AAAA"),
-            (domain, "MX"),
-            (domain, "TXT"),  # Includes SPF
-            (f"_dmarc.{domain}", "TXT"),  # DMARC
-        ]
-
-        for name, rdtype in record_queries:
+        for (name, rdtype), answer in zip(record_queries, answers):
+            if isinstance(answer, BaseException):
+                continue
             try:
-                answer = self._query(name, rdtype)
                 if answer:
                     # Check for RRSIG
-                    has_rrsig = False
-                    rrsig_info = None
-                    if answer.response:
-                        for rrset in answer.response.answer:
-                            if rrset.rdtype == dns.rdatatype.RRSIG:
-                                for rdata in rrset:
-                                    if isinstance(rdata, RRSIG):
-                                        has_rrsig = True
-                                        rrsig_info = self._formatter.parse_rrsig(rdata)
-                                        break
+                    rrsig_info = self._first_rrsig(answer)
+                    has_rrsig = rrsig_info is not None
+                    ttl = answer.rrset.ttl if answer.rrset else 0
 
                     for rdata in answer:
                         # Determine record type label
                         record_type = rdtype
                         value = str(rdata)
 
-                        # Identify SPF records
-                        if rdtype == "TXT" and "v=spf1" in value.lower():
-                            record_type = "SPF"
+                        if value.startswith('"'):
+                            value = value.strip('"')
 
-                        # Identify DMARC records
-                        if "_dmarc" in name and "v=dmarc1" in value.lower():
-                            record_type = "DMARC"
+                        # Identify SPF and DMARC records by their version tag
+                        if rdata.rdtype == _TXT_RDTYPE:
+                            record_type = _classify_txt(name, value)
 
                         record = AdditionalRecord(
                             record_type=record_type,
                             name=name,
-                            value=value.strip('"'),
-                            ttl=answer.rrset.ttl if answer.rrset else 0,
+                            value=value,
+                            ttl=ttl,
                             is_signed=has_rrsig,
                             rrsig=rrsig_info,
                         )
@@ -290,32 +624,19 @@ class DNSResolver:
             List of zone names from root to domain
             (e.g., [".", "com.", "example.com."])
         """
-        # Normalize domain
-        if not domain.endswith('.'):
-            domain = domain + '.'
+        return list(_zone_hierarchy(domain))
 
-        # Split into labels (e.g., "www.example.com." -> ["www", "example", "com", ""])
-        parts = domain.rstrip('.').split('.')
-
-        # Build hierarchy from root to target
-        # For "devries.tv" -> [".", "tv.", "devries.tv."]
-        zones = ["."]  # Always start with root
-
-        # Build each zone level
-        for i in range(len(parts) - 1, -1, -1):
-            zone = ".".join(parts[i:]) + "."
-            if zone != "." and zone not in zones:
-                zones.append(zone)
-
-        return zones
-
-    def query_zone_chain(
+    async def query_zone_chain(
         self,
         domain: str,
         check_consistency: bool = True
     ) -> tuple[list[ZoneInfo], float]:
         """Query the complete DNSSEC chain for a domain.
 
+        Zones, and the individual lookups within each zone, are independent
+        of each other, so they are all fetched concurrently on the running
+        event loop.
+
         Args:
             domain: Target domain
             check_consistency: Whether to check consistency across nameservers
@@ -324,34 +645,61 @@ class DNSResolver:
             Tuple of (list of ZoneInfo objects, query time in ms)
         """
         start_time = time.time()
-        zones = []
+
+        # Normalize once; the target zone is always the last hierarchy entry
+        if not domain.endswith('.'):
+            domain = domain + '.'
         hierarchy = self.get_zone_hierarchy(domain)
+        target_index = len(hierarchy) - 1
+
+        async def _fetch_zone(i: int) -> ZoneInfo:
+            zone_name = hierarchy[i]
+
+            # Every lookup for a zone is independent, run them side by side:
+            # DS (not for root), additional records (target only) and the
+            # consistency check (skip root zone - too many servers)
+            lookups = {"dnskeys": self.query_dnskeys(zone_name)}
+            if zone_name != ".":
+                lookups["ds"] = self.query_ds(zone_name)
+            if i == target_index:
+                lookups["additional"] = self.query_additional_records(domain)
+            if check_consistency and zone_name != ".":
+                lookups["consistency"] = self.check_consistency(zone_name)
 
-        for i, zone_name in enumerate(hierarchy):
-            zone_info = self.query_dnskeys(zone_name)
+            results = dict(zip(lookups, await asyncio.gather(*lookups.values())))
+
+            zone_info = results["dnskeys"]
+            zone_info.ds_records = results.get("ds", [])
+            zone_info.additional_records = results.get("additional", [])
+            zone_info.consistency = results.get("consistency")
 
             # Set parent zone
             if i > 0:
                 zone_info.parent = hierarchy[i - 1]
 
-            # Query DS records (not for root)
-            if zone_name != ".":
-                zone_info.ds_records = self.query_ds(zone_name)
-
-            # For the target domain, also get additional records
-            if zone_name == hierarchy[-1] or domain.rstrip('.') + '.' == zone_name:
-                zone_info.additional_records = self.query_additional_records(domain)
+            return zone_info
 
-            # Perform consistency check (skip root zone - too many servers)
-            if check_consistency and zone_name != ".":
-                zone_info.consistency = self.check_consistency(zone_name)
-
-            zones.append(zone_info)
+        # gather() keeps the root-to-target order
+        zones = list(await asyncio.gather(
+            *(_fetch_zone(i) for i in range(len(hierarchy)))
+        ))
 
         query_time = (time.time() - start_time) * 1000
         return zones, query_time
 
-    def get_authoritative_nameservers(self, zone: str) -> list[tuple[str, str]]:
+    def query_zone_chain_sync(
+        self,
+        domain: str,
+        check_consistency: bool = True
+    ) -> tuple[list[ZoneInfo], float]:
+        """Blocking form of query_zone_chain for callers without an event loop.
+
+        Must not be called from a running event loop; await
+        query_zone_chain there instead.
+        """
+        return asyncio.run(self.query_zone_chain(domain, check_consistency))
+
+    async def get_authoritative_nameservers(self, zone: str) -> list[tuple[str, str]]:
         """Get authoritative nameservers for a zone.
 
         Args:
@@ -364,28 +712,28 @@ class DNSResolver:
 
         try:
             # Query NS records
-            ns_answer = self._query(zone, "NS")
+            ns_answer = await self._query(zone, "NS")
             if not ns_answer:
                 return []
 
-            for rdata in ns_answer:
-                ns_name = str(rdata.target)
+            # Resolve every NS to IP concurrently
+            ns_names = [str(rdata.target) for rdata in ns_answer]
+            ns_ips = await asyncio.gather(
+                *(self._resolve_ns_ips(ns_name) for ns_name in ns_names),
+                return_exceptions=True,
+            )
 
-                # Resolve NS to IP
-                try:
-                    a_answer = self._query(ns_name, "A")
-                    if a_answer:
-                        for a_rdata in a_answer:
-                            nameservers.append((ns_name, str(a_rdata)))
-                except Exception:
-                    pass
+            for ns_name, ips in zip(ns_names, ns_ips):
+                if ips and not isinstance(ips, BaseException):
+                    for ip in ips:
+                        nameservers.append((ns_name, ip))
 
         except Exception:
             pass
 
         return nameservers
 
-    def query_nameserver_direct(
+    async def query_nameserver_direct(
         self,
         nameserver_ip: str,
         zone: str,
@@ -410,7 +758,8 @@ class DNSResolver:
         try:
             start_time = time.time()
 
-            # Build DNSKEY query with DO bit
+            # Build DNSKEY query with DO bit; each probe gets its own
+            # message and so its own random query ID
             query = dns.message.make_query(
                 zone,
                 dns.rdatatype.DNSKEY,
@@ -418,7 +767,7 @@ class DNSResolver:
             )
 
             # Query the specific nameserver
-            answer = dns.query.udp(
+            answer = await dns.asyncquery.udp(
                 query,
                 nameserver_ip,
                 timeout=timeout
@@ -427,14 +776,14 @@ class DNSResolver:
             response.response_time_ms = (time.time() - start_time) * 1000
             response.responded = True
 
-            # Extract DNSKEY key tags
+            # Extract DNSKEY key tags; an RRset holds a single rdtype, so
+            # its rdata need no per-record type check
             for rrset in answer.answer:
-                if rrset.rdtype == dns.rdatatype.DNSKEY:
+                if rrset.rdtype == _DNSKEY_RDTYPE:
                     for rdata in rrset:
-                        if isinstance(rdata, DNSKEY):
-                            key_info = self._formatter.parse_dnskey(rdata)
-                            response.dnskey_tags.append(key_info.key_tag)
-                elif rrset.rdtype == dns.rdatatype.RRSIG:
+                        key_info = self._formatter.parse_dnskey(rdata)
+                        response.dnskey_tags.append(key_info.key_tag)
+                elif rrset.rdtype == _RRSIG_RDTYPE:
                     response.has_rrsig = True
 
         except dns.exception.Timeout:
@@ -444,16 +793,18 @@ class DNSResolver:
 
         return response
 
-    def check_consistency(
+    async def check_consistency(
         self,
         zone: str,
-        max_servers: int = 5
+        max_servers: int = 5,
+        timeout: float = 3.0
     ) -> ConsistencyResult:
         """Check DNSKEY consistency across authoritative nameservers.
 
         Args:
             zone: Zone to check
             max_servers: Maximum number of servers to query
+            timeout: Timeout in seconds for each nameserver probe
 
         Returns:
             ConsistencyResult with findings
@@ -461,7 +812,7 @@ class DNSResolver:
         result = ConsistencyResult(zone_name=zone)
 
         # Get authoritative nameservers
-        nameservers = self.get_authoritative_nameservers(zone)
+        nameservers = await self.get_authoritative_nameservers(zone)
         if not nameservers:
             result.issues.append("Could not find authoritative nameservers")
             return result
@@ -470,28 +821,33 @@ class DNSResolver:
         nameservers = nameservers[:max_servers]
         result.nameservers_queried = len(nameservers)
 
-        # Query each nameserver
-        all_key_sets = []
+        # Query all nameservers at once, each probe with its own timeout, so
+        # the check takes max(RTT) rather than sum(RTT)
+        responses = await asyncio.gather(
+            *(
+                self.query_nameserver_direct(ns_ip, zone, timeout)
+                for _, ns_ip in nameservers
+            )
+        )
+        responded = []
 
-        for ns_name, ns_ip in nameservers:
-            response = self.query_nameserver_direct(ns_ip, zone)
+        for (ns_name, _), response in zip(nameservers, responses):
             response.server_name = ns_name
             result.server_responses.append(response)
 
             if response.responded:
                 result.nameservers_responded += 1
-                all_key_sets.append(set(response.dnskey_tags))
-
-        # Check for consistency
-        if len(all_key_sets) > 1:
-            # Compare all key sets
-            reference_set = all_key_sets[0]
-            for i, key_set in enumerate(all_key_sets[1:], 1):
+                responded.append((response, frozenset(response.dnskey_tags)))
+
+        # Check for consistency; identical key sets (the usual case) collapse
+        # to one, and only a mismatch needs the per-server diffs
+        if len({key_set for _, key_set in responded}) > 1:
+            result.is_consistent = False
+            reference_set = responded[0][1]
+            for server, key_set in responded[1:]:
                 if key_set != reference_set:
-                    result.is_consistent = False
-                    missing = reference_set - key_set
-                    extra = key_set - reference_set
-                    server = result.server_responses[i]
+                    missing = set(reference_set - key_set)
+                    extra = set(key_set - reference_set)
                     if missing:
                         result.issues.append(
                             f"{server.server_name} missing keys: {missing}"
@@ -502,11 +858,8 @@ class DNSResolver:
                         )
 
         # Check for servers that didn't respond
-        non_responsive = [
-            r for r in result.server_responses if not r.responded
-        ]
-        if non_responsive:
-            for r in non_responsive:
+        for r in result.server_responses:
+            if not r.responded:
                 result.issues.append(
                     f"{r.server_ip} did not respond: {r.error or 'unknown'}"
                 )
@@ -1,6 +1,6 @@
 """Export functionality for DNSSEC analysis results."""
 
-from dnsviz_tui.export.json_export import export_json
+from dnsviz_tui.export.json_export import export_json, write_json
 from dnsviz_tui.export.text_export import export_text
 
-__all__ = ["export_json", "export_text"]
+__all__ = ["export_json", "export_text", "write_json"]
@@ -1,11 +1,40 @@
 """JSON export functionality."""
 
 import json
+import operator
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-
-from dnsviz_tui.models.chain import TrustChain, ZoneInfo, ValidationStatus
+from typing import Any, BinaryIO
+
+from dnsviz_tui.models.chain import TrustChain, ZoneInfo, RRSIGInfo, ValidationStatus
+
+# Optional fast JSON encoder (pip install dnsviz-tui[speedups])
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Exported attributes per record type, in output order
+_DNSKEY_FIELDS = (
+    "flags", "protocol", "algorithm", "algorithm_name", "key_tag",
+    "key_length", "is_ksk", "is_zsk", "key_data",
+)
+_DS_FIELDS = (
+    "key_tag", "algorithm", "algorithm_name", "digest_type",
+    "digest_type_name", "digest", "validates_key",
+)
+_RRSIG_FIELDS = (
+    "type_covered", "algorithm", "algorithm_name", "labels", "original_ttl",
+)
+_RRSIG_SIGNER_FIELDS = ("key_tag", "signer_name", "is_valid")
+_ADDITIONAL_FIELDS = ("record_type", "name", "value", "ttl", "is_signed")
+
+_get_dnskey = operator.attrgetter(*_DNSKEY_FIELDS)
+_get_ds = operator.attrgetter(*_DS_FIELDS)
+_get_rrsig = operator.attrgetter(*_RRSIG_FIELDS)
+_get_rrsig_signer = operator.attrgetter(*_RRSIG_SIGNER_FIELDS)
+_get_additional = operator.attrgetter(*_ADDITIONAL_FIELDS)
 
 
 def _serialize_datetime(dt: datetime) -> str:
@@ -22,7 +51,19 @@ def _serialize_status(status: ValidationStatus) -> dict[str, Any]:
     }
 
 
-def _serialize_zone(zone: ZoneInfo) -> dict[str, Any]:
+def _serialize_rrsig(rrsig: RRSIGInfo, now: float) -> dict[str, Any]:
+    """Serialize an RRSIG to dict, with its validity evaluated at now."""
+    is_expired, _, days_until_expiry = rrsig.snapshot(now)
+    data = dict(zip(_RRSIG_FIELDS, _get_rrsig(rrsig)))
+    data["expiration"] = _serialize_datetime(rrsig.expiration)
+    data["inception"] = _serialize_datetime(rrsig.inception)
+    data.update(zip(_RRSIG_SIGNER_FIELDS, _get_rrsig_signer(rrsig)))
+    data["is_expired"] = is_expired
+    data["days_until_expiry"] = days_until_expiry
+    return data
+
+
+def _serialize_zone(zone: ZoneInfo, now: float) -> dict[str, Any]:
     """Serialize a zone to dict."""
     return {
         "name": zone.name,
@@ -33,64 +74,18 @@ def _serialize_zone(zone: ZoneInfo) -> dict[str, Any]:
         "ds_validated": zone.ds_validated,
         "dnskey_validated": zone.dnskey_validated,
         "chain_complete": zone.chain_complete,
-        "dnskeys": [
-            {
-                "flags": key.flags,
-                "protocol": key.protocol,
-                "algorithm": key.algorithm,
-                "algorithm_name": key.algorithm_name,
-                "key_tag": key.key_tag,
-                "key_length": key.key_length,
-                "is_ksk": key.is_ksk,
-                "is_zsk": key.is_zsk,
-                "key_data": key.key_data,
-            }
-            for key in zone.dnskeys
-        ],
-        "ds_records": [
-            {
-                "key_tag": ds.key_tag,
-                "algorithm": ds.algorithm,
-                "algorithm_name": ds.algorithm_name,
-                "digest_type": ds.digest_type,
-                "digest_type_name": ds.digest_type_name,
-                "digest": ds.digest,
-                "validates_key": ds.validates_key,
-            }
-            for ds in zone.ds_records
-        ],
-        "rrsigs": [
-            {
-                "type_covered": rrsig.type_covered,
-                "algorithm": rrsig.algorithm,
-                "algorithm_name": rrsig.algorithm_name,
-                "labels": rrsig.labels,
-                "original_ttl": rrsig.original_ttl,
-                "expiration": _serialize_datetime(rrsig.expiration),
-                "inception": _serialize_datetime(rrsig.inception),
-                "key_tag": rrsig.key_tag,
-                "signer_name": rrsig.signer_name,
-                "is_valid": rrsig.is_valid,
-                "is_expired": rrsig.is_expired,
-                "days_until_expiry": rrsig.days_until_expiry,
-            }
-            for rrsig in zone.rrsigs
-        ],
+        "dnskeys": [dict(zip(_DNSKEY_FIELDS, _get_dnskey(key))) for key in zone.dnskeys],
+        "ds_records": [dict(zip(_DS_FIELDS, _get_ds(ds))) for ds in zone.ds_records],
+        "rrsigs": [_serialize_rrsig(rrsig, now) for rrsig in zone.rrsigs],
         "additional_records": [
-            {
-                "record_type": rec.record_type,
-                "name": rec.name,
-                "value": rec.value,
-                "ttl": rec.ttl,
-                "is_signed": rec.is_signed,
-            }
+            dict(zip(_ADDITIONAL_FIELDS, _get_additional(rec)))
             for rec in zone.additional_records
         ],
     }
 
 
-def chain_to_dict(chain: TrustChain) -> dict[str, Any]:
-    """Convert a TrustChain to a dictionary."""
+def _chain_header(chain: TrustChain) -> dict[str, Any]:
+    """Return the chain-level fields of the export (everything but zones)."""
     return {
         "metadata": {
             "target_domain": chain.target_domain,
@@ -102,10 +97,64 @@ def chain_to_dict(chain: TrustChain) -> dict[str, Any]:
         "overall_status": _serialize_status(chain.overall_status),
         "overall_reason": chain.overall_reason,
         "chain_path": chain.chain_path(),
-        "zones": [_serialize_zone(zone) for zone in chain.zones],
     }
 
 
+def chain_to_dict(chain: TrustChain) -> dict[str, Any]:
+    """Convert a TrustChain to a dictionary."""
+    # One clock read so every RRSIG status is judged at the same instant
+    now = time.time()
+    data = _chain_header(chain)
+    data["zones"] = [_serialize_zone(zone, now) for zone in chain.zones]
+    return data
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode obj as UTF-8 JSON with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_json(chain: TrustChain, f: BinaryIO) -> None:
+    """Write the export to f one zone at a time.
+
+    Produces the same bytes as encoding chain_to_dict() in one go, but only
+    a single zone is held in encoded form at any time. The enclosing object
+    and the zones array are framed here; only their members are encoded.
+    """
+    now = time.time()
+    f.write(b"{")
+    for key, value in _chain_header(chain).items():
+        f.write(b"\n  " + _dumps(key) + b": " + _dumps(value).replace(b"\n", b"\n  "))
+        f.write(b",")
+    if not chain.zones:
+        f.write(b'\n  "zones": []\n}')
+        return
+    f.write(b'\n  "zones": [')
+    for i, zone in enumerate(chain.zones):
+        if i:
+            f.write(b",")
+        f.write(b"\n    " + _dumps(_serialize_zone(zone, now)).replace(b"\n", b"\n    "))
+    f.write(b"\n  ]\n}")
+
+
+def write_json(chain: TrustChain, path: Path | str) -> None:
+    """Stream the JSON export of a trust chain to a file.
+
+    Writes the same content as export_json() without building the whole
+    document in memory first.
+
+    Args:
+        chain: The trust chain to export
+        path: File path to write to
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        _write_json(chain, f)
+
+
 def export_json(chain: TrustChain, path: Path | str | None = None) -> str:
     """Export trust chain to JSON.
 
@@ -116,12 +165,11 @@ def export_json(chain: TrustChain, path: Path | str | None = None) -> str:
     Returns:
         JSON string
     """
-    data = chain_to_dict(chain)
-    json_str = json.dumps(data, indent=2)
+    json_bytes = _dumps(chain_to_dict(chain))
 
     if path:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json_str)
+        path.write_bytes(json_bytes)
 
-    return json_str
+    return json_bytes.decode("utf-8")
@@ -1,9 +1,10 @@
 """Plain text export functionality."""
 
+import time
 from datetime import datetime
 from pathlib import Path
 
-from dnsviz_tui.models.chain import TrustChain, ZoneInfo, ValidationStatus
+from dnsviz_tui.models.chain import TrustChain, ZoneInfo
 
 
 def _format_header(chain: TrustChain) -> str:
@@ -18,7 +19,7 @@ def _format_header(chain: TrustChain) -> str:
         f"Query Duration: {chain.query_duration_ms:.2f}ms",
         f"Resolver:      {chain.resolver_used}",
         "",
-        f"Overall Status: {chain.overall_status.symbol} {chain.overall_status.value.upper()}",
+        f"Overall Status: {chain.overall_status.display_text}",
         f"Reason:        {chain.overall_reason}",
         "",
         f"Chain Path:    {' -> '.join(chain.chain_path())}",
@@ -27,13 +28,13 @@ def _format_header(chain: TrustChain) -> str:
     return "\n".join(lines)
 
 
-def _format_zone(zone: ZoneInfo) -> str:
+def _format_zone(zone: ZoneInfo, now: float) -> str:
     """Format a zone section."""
     lines = [
         "-" * 70,
         f"Zone: {zone.name}",
         "-" * 70,
-        f"Status: {zone.status.symbol} {zone.status.value.upper()}",
+        f"Status: {zone.status.display_text}",
     ]
 
     if zone.status_reason:
@@ -72,7 +73,8 @@ def _format_zone(zone: ZoneInfo) -> str:
     if zone.rrsigs:
         lines.append("RRSIG Records:")
         for rrsig in zone.rrsigs:
-            status = "EXPIRED" if rrsig.is_expired else f"valid {rrsig.days_until_expiry}d"
+            expired, _, days = rrsig.snapshot(now)
+            status = "EXPIRED" if expired else f"valid {days}d"
             lines.append(
                 f"  Covers: {rrsig.type_covered}, "
                 f"Key: {rrsig.key_tag}, "
@@ -141,8 +143,10 @@ def export_text(chain: TrustChain, path: Path | str | None = None) -> str:
     """
     sections = [_format_header(chain)]
 
+    # One clock read so every RRSIG status is judged at the same instant
+    now = time.time()
     for zone in chain.zones:
-        sections.append(_format_zone(zone))
+        sections.append(_format_zone(zone, now))
 
     sections.append(_format_summary(chain))
 
@@ -1,14 +1,18 @@
 """Data models for DNSSEC chain of trust."""
 
-from dnsviz_tui.models.chain import (
-    ValidationStatus,
-    DNSKeyInfo,
-    DSInfo,
-    RRSIGInfo,
-    ZoneInfo,
-    TrustChain,
-    AdditionalRecord,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dnsviz_tui.models.chain import (
+        ValidationStatus,
+        DNSKeyInfo,
+        DSInfo,
+        RRSIGInfo,
+        ZoneInfo,
+        TrustChain,
+        AdditionalRecord,
+    )
 
 __all__ = [
     "ValidationStatus",
@@ -19,3 +23,14 @@ __all__ = [
     "TrustChain",
     "AdditionalRecord",
 ]
+
+
+# Models are imported on first access (PEP 562)
+def __getattr__(name: str):
+    if name in __all__:
+        return getattr(importlib.import_module("dnsviz_tui.models.chain"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,11 +1,21 @@
 """Data models for DNSSEC chain of trust."""
 
+import base64
+import struct
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
 
+# DNSKEY RDATA header: flags (2) + protocol (1) + algorithm (1)
+_DNSKEY_HEADER = struct.Struct("!HBB")
+
+# RRSIG timestamps are POSIX seconds; datetimes are derived from this on demand
+_EPOCH = datetime(1970, 1, 1)
+
+
 class ValidationStatus(Enum):
     """DNSSEC validation status."""
     SECURE = "secure"           # Fully validated chain
@@ -17,29 +27,50 @@ class ValidationStatus(Enum):
     @property
     def color(self) -> str:
         """Return the Rich color for this status."""
-        colors = {
-            ValidationStatus.SECURE: "green",
-            ValidationStatus.INSECURE: "yellow",
-            ValidationStatus.BOGUS: "red",
-            ValidationStatus.INDETERMINATE: "orange1",
-            ValidationStatus.UNKNOWN: "dim",
-        }
-        return colors.get(self, "white")
+        return _STATUS_COLORS[self]
 
     @property
     def symbol(self) -> str:
         """Return a symbol for this status."""
-        symbols = {
-            ValidationStatus.SECURE: "✓",
-            ValidationStatus.INSECURE: "○",
-            ValidationStatus.BOGUS: "✗",
-            ValidationStatus.INDETERMINATE: "?",
-            ValidationStatus.UNKNOWN: "·",
-        }
-        return symbols.get(self, "·")
+        return _STATUS_SYMBOLS[self]
+
+    @property
+    def display_text(self) -> str:
+        """Return the symbol and upper-case name (e.g. "✓ SECURE")."""
+        return _STATUS_DISPLAY_TEXTS[self]
+
+    @property
+    def bold_style(self) -> str:
+        """Return the bold Rich style for this status."""
+        return _STATUS_BOLD_STYLES[self]
+
+
+# Per-status presentation, built once rather than on every property access.
+# Both tables cover every member, so the properties subscript them directly.
+_STATUS_COLORS = {
+    ValidationStatus.SECURE: "green",
+    ValidationStatus.INSECURE: "yellow",
+    ValidationStatus.BOGUS: "red",
+    ValidationStatus.INDETERMINATE: "orange1",
+    ValidationStatus.UNKNOWN: "dim",
+}
+
+_STATUS_SYMBOLS = {
+    ValidationStatus.SECURE: "✓",
+    ValidationStatus.INSECURE: "○",
+    ValidationStatus.BOGUS: "✗",
+    ValidationStatus.INDETERMINATE: "?",
+    ValidationStatus.UNKNOWN: "·",
+}
 
+_STATUS_DISPLAY_TEXTS = {
+    status: f"{_STATUS_SYMBOLS[status]} {status.value.upper()}" for status in ValidationStatus
+}
 
-@dataclass
+_STATUS_BOLD_STYLES = {status: f"bold {_STATUS_COLORS[status]}" for status in ValidationStatus}
+
+
+@dataclass(slots=True)
 class DNSKeyInfo:
     """Information about a DNSKEY record."""
     flags: int                  # 256 = ZSK, 257 = KSK
@@ -49,21 +80,29 @@ class DNSKeyInfo:
     key_tag: int                # Key tag (identifier)
     key_data: str               # Base64-encoded public key (truncated for display)
     key_length: int             # Key length in bits
-    is_ksk: bool = field(init=False)
-    is_zsk: bool = field(init=False)
-    is_sep: bool = field(init=False)  # Secure Entry Point
+    rrsig: Optional["RRSIGInfo"] = field(default=None, repr=False, compare=False)  # This key's signature over the DNSKEY RRset
+    _rdata: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
-    def __post_init__(self):
-        self.is_ksk = (self.flags & 0x0001) == 1  # KSK has SEP bit set
-        self.is_zsk = (self.flags & 0x0001) == 0  # ZSK does not have SEP bit
-        self.is_sep = (self.flags & 0x0001) == 1
+    # Key roles are read straight off the SEP bit (0x0001) of flags
+    @property
+    def is_ksk(self) -> bool:
+        """Return True for a key signing key (SEP bit set)."""
+        return self.flags & 0x0001 == 1
+
+    @property
+    def is_zsk(self) -> bool:
+        """Return True for a zone signing key (SEP bit clear)."""
+        return self.flags & 0x0001 == 0
+
+    @property
+    def is_sep(self) -> bool:
+        """Return True if the Secure Entry Point bit is set."""
+        return self.flags & 0x0001 == 1
 
     @property
     def key_type(self) -> str:
         """Return human-readable key type."""
-        if self.is_ksk:
-            return "KSK"
-        return "ZSK"
+        return "KSK" if self.flags & 0x0001 else "ZSK"
 
     @property
     def display_key(self) -> str:
@@ -72,8 +111,16 @@ class DNSKeyInfo:
             return f"{self.key_data[:16]}...{self.key_data[-16:]}"
         return self.key_data
 
+    @property
+    def rdata(self) -> bytes:
+        """Return the DNSKEY RDATA in wire format (built once, then cached)."""
+        if self._rdata is None:
+            header = _DNSKEY_HEADER.pack(self.flags, self.protocol, self.algorithm)
+            self._rdata = header + base64.b64decode(self.key_data)
+        return self._rdata
 
-@dataclass
+
+@dataclass(slots=True)
 class DSInfo:
     """Information about a DS (Delegation Signer) record."""
     key_tag: int                # References a DNSKEY
@@ -83,6 +130,13 @@ class DSInfo:
     digest_type_name: str       # Human-readable digest type
     digest: str                 # The digest value (hex)
     validates_key: Optional[int] = None  # Key tag this validates (if verified)
+    digest_bytes: bytes = field(default=b"", repr=False)  # Raw digest for comparisons
+
+    def __post_init__(self):
+        # Parsed records arrive with both forms already filled in
+        if not self.digest_bytes and self.digest:
+            self.digest = self.digest.upper()
+            self.digest_bytes = bytes.fromhex(self.digest)
 
     @property
     def display_digest(self) -> str:
@@ -92,7 +146,7 @@ class DSInfo:
         return self.digest
 
 
-@dataclass
+@dataclass(slots=True)
 class RRSIGInfo:
     """Information about an RRSIG (signature) record."""
     type_covered: str           # Record type this signs (e.g., "DNSKEY", "A")
@@ -100,43 +154,68 @@ class RRSIGInfo:
     algorithm_name: str         # Human-readable algorithm name
     labels: int                 # Number of labels in original name
     original_ttl: int           # Original TTL
-    expiration: datetime        # Signature expiration
-    inception: datetime         # Signature inception
+    expiration_ts: int          # Signature expiration (POSIX seconds, wire value)
+    inception_ts: int           # Signature inception (POSIX seconds, wire value)
     key_tag: int                # Key tag of signing key
     signer_name: str            # Name of the signer
     signature: str              # Base64-encoded signature
     is_valid: Optional[bool] = None  # Validation result
     validation_error: Optional[str] = None
 
+    @property
+    def expiration(self) -> datetime:
+        """Signature expiration as a naive UTC datetime."""
+        return _EPOCH + timedelta(seconds=self.expiration_ts)
+
+    @property
+    def inception(self) -> datetime:
+        """Signature inception as a naive UTC datetime."""
+        return _EPOCH + timedelta(seconds=self.inception_ts)
+
     @property
     def is_expired(self) -> bool:
         """Check if signature has expired."""
-        return datetime.utcnow() > self.expiration
+        return time.time() > self.expiration_ts
 
     @property
     def is_not_yet_valid(self) -> bool:
         """Check if signature is not yet valid."""
-        return datetime.utcnow() < self.inception
+        return time.time() < self.inception_ts
 
     @property
     def days_until_expiry(self) -> int:
         """Return days until expiration (negative if expired)."""
-        delta = self.expiration - datetime.utcnow()
-        return delta.days
+        return int((self.expiration_ts - time.time()) // 86400)
+
+    def snapshot(self, now: Optional[float] = None) -> tuple[bool, bool, int]:
+        """Return (is_expired, is_not_yet_valid, days_until_expiry) at one instant.
+
+        Args:
+            now: POSIX time to evaluate at; reads the clock once if None.
+                Pass the same value for every RRSIG rendered together.
+        """
+        if now is None:
+            now = time.time()
+        return (
+            now > self.expiration_ts,
+            now < self.inception_ts,
+            int((self.expiration_ts - now) // 86400),
+        )
 
     @property
     def validity_status(self) -> str:
         """Return human-readable validity status."""
-        if self.is_expired:
-            return f"EXPIRED ({abs(self.days_until_expiry)} days ago)"
-        if self.is_not_yet_valid:
+        expired, not_yet_valid, days = self.snapshot()
+        if expired:
+            return f"EXPIRED ({abs(days)} days ago)"
+        if not_yet_valid:
             return "NOT YET VALID"
-        if self.days_until_expiry < 7:
-            return f"EXPIRING SOON ({self.days_until_expiry} days)"
-        return f"Valid ({self.days_until_expiry} days)"
+        if days < 7:
+            return f"EXPIRING SOON ({days} days)"
+        return f"Valid ({days} days)"
 
 
-@dataclass
+@dataclass(slots=True)
 class NSECInfo:
     """Information about NSEC/NSEC3 records."""
     record_type: str            # "NSEC" or "NSEC3"
@@ -149,7 +228,7 @@ class NSECInfo:
     salt: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AdditionalRecord:
     """Additional DNS records (SPF, DMARC, etc.)."""
     record_type: str            # "SPF", "DMARC", "DKIM", "MX", etc.
@@ -160,7 +239,7 @@ class AdditionalRecord:
     rrsig: Optional[RRSIGInfo] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerResponse:
     """Response from a single authoritative nameserver."""
     server_ip: str              # IP address of the server
@@ -175,7 +254,7 @@ class ServerResponse:
     has_rrsig: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsistencyResult:
     """Result of checking consistency across authoritative nameservers."""
     zone_name: str
@@ -197,7 +276,7 @@ class ConsistencyResult:
         return f"INCONSISTENT ({len(self.issues)} issues)"
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneInfo:
     """Information about a single zone in the chain."""
     name: str                   # Zone name (e.g., "example.com.")
@@ -222,6 +301,47 @@ class ZoneInfo:
     # Consistency check results
     consistency: Optional[ConsistencyResult] = None
 
+    # Lookup indexes, built on first use. Code that changes dnskeys or
+    # rrsigs after they have been read must call invalidate_indexes().
+    _key_index: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _rrsig_index: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def invalidate_indexes(self) -> None:
+        """Drop the key and RRSIG indexes so the next lookup rebuilds them."""
+        self._key_index = None
+        self._rrsig_index = None
+
+    def _keys_indexed(self) -> tuple:
+        """Return (keys by tag, KSKs), building them on first use."""
+        if self._key_index is None:
+            by_tag: dict[int, list[DNSKeyInfo]] = {}
+            ksks = []
+            for key in self.dnskeys:
+                by_tag.setdefault(key.key_tag, []).append(key)
+                if key.is_ksk:
+                    ksks.append(key)
+            self._key_index = (by_tag, ksks)
+        return self._key_index
+
+    @property
+    def keys_by_tag(self) -> dict[int, list[DNSKeyInfo]]:
+        """DNSKEYs grouped by key tag."""
+        return self._keys_indexed()[0]
+
+    @property
+    def ksks(self) -> list[DNSKeyInfo]:
+        """DNSKEYs with the SEP bit set."""
+        return self._keys_indexed()[1]
+
+    def rrsigs_covering(self, type_covered: str) -> list[RRSIGInfo]:
+        """Return RRSIGs covering the given record type (e.g. "DNSKEY")."""
+        if self._rrsig_index is None:
+            by_type: dict[str, list[RRSIGInfo]] = {}
+            for rrsig in self.rrsigs:
+                by_type.setdefault(rrsig.type_covered, []).append(rrsig)
+            self._rrsig_index = by_type
+        return self._rrsig_index.get(type_covered, [])
+
     @property
     def has_dnssec(self) -> bool:
         """Check if zone has DNSSEC."""
@@ -230,22 +350,27 @@ class ZoneInfo:
     @property
     def ksk_count(self) -> int:
         """Count KSK keys."""
-        return sum(1 for k in self.dnskeys if k.is_ksk)
+        return len(self.ksks)
 
     @property
     def zsk_count(self) -> int:
         """Count ZSK keys."""
-        return sum(1 for k in self.dnskeys if k.is_zsk)
+        # ZSK is the complement of KSK (SEP bit clear)
+        return len(self.dnskeys) - len(self.ksks)
+
+    @property
+    def valid_rrsig_count(self) -> int:
+        """Count RRSIGs marked valid."""
+        # Not indexed: is_valid is set by the validator after parsing
+        return sum(1 for rrsig in self.rrsigs if rrsig.is_valid)
 
     def get_key_by_tag(self, tag: int) -> Optional[DNSKeyInfo]:
         """Find a DNSKEY by its key tag."""
-        for key in self.dnskeys:
-            if key.key_tag == tag:
-                return key
-        return None
+        keys = self.keys_by_tag.get(tag)
+        return keys[0] if keys else None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrustChain:
     """Complete chain of trust from root to target domain."""
     target_domain: str          # The queried domain
@@ -258,6 +383,14 @@ class TrustChain:
     resolver_used: str = ""
     query_duration_ms: float = 0.0
 
+    # Name -> zone index, built on first use. Code that changes zones after
+    # it has been read must call invalidate_indexes().
+    _zone_index: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def invalidate_indexes(self) -> None:
+        """Drop the zone index so the next lookup rebuilds it."""
+        self._zone_index = None
+
     @property
     def is_secure(self) -> bool:
         """Check if the entire chain is secure."""
@@ -270,10 +403,12 @@ class TrustChain:
 
     def get_zone(self, name: str) -> Optional[ZoneInfo]:
         """Get a zone by name."""
-        for zone in self.zones:
-            if zone.name == name:
-                return zone
-        return None
+        if self._zone_index is None:
+            by_name: dict[str, ZoneInfo] = {}
+            for zone in self.zones:
+                by_name.setdefault(zone.name, zone)
+            self._zone_index = by_name
+        return self._zone_index.get(name)
 
     @property
     def root_zone(self) -> Optional[ZoneInfo]:
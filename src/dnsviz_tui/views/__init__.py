@@ -1,7 +1,29 @@
 """Visualization views for DNSSEC chain of trust."""
 
-from dnsviz_tui.views.tree_view import TreeView
-from dnsviz_tui.views.diagram_view import DiagramView
-from dnsviz_tui.views.table_view import TableView
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dnsviz_tui.views.tree_view import TreeView
+    from dnsviz_tui.views.diagram_view import DiagramView
+    from dnsviz_tui.views.table_view import TableView
 
 __all__ = ["TreeView", "DiagramView", "TableView"]
+
+# Views are imported on first access (PEP 562), so loading one view module
+# does not pull in the others and their widget dependencies
+_LAZY = {
+    "TreeView": "dnsviz_tui.views.tree_view",
+    "DiagramView": "dnsviz_tui.views.diagram_view",
+    "TableView": "dnsviz_tui.views.table_view",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,32 @@
+"""Helpers shared by the chain views."""
+
+from rich.table import Table
+from rich.text import Text
+
+from dnsviz_tui.models.chain import TrustChain
+
+
+def build_header(chain: TrustChain) -> Table:
+    """Build the domain / overall status / query time header grid."""
+    header = Table.grid(padding=(0, 2))
+    header.add_column()
+    header.add_column()
+    header.add_column()
+
+    status_text = Text()
+    overall = chain.overall_status
+    status_text.append(overall.display_text, style=overall.bold_style)
+
+    header.add_row(
+        Text(f"Domain: {chain.target_domain}", style="bold"),
+        status_text,
+        Text(f"Query: {chain.query_duration_ms:.0f}ms", style="dim"),
+    )
+    return header
+
+
+def truncate(value: str, max_len: int) -> str:
+    """Shorten value to max_len characters, ending with '...' when cut."""
+    if len(value) <= max_len:
+        return value
+    return f"{value[:max_len - 3]}..."
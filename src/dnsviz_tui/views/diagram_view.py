@@ -1,6 +1,12 @@
 """ASCII diagram view visualization for DNSSEC chain of trust."""
 
-from rich.console import RenderableType, Group
+import functools
+import operator
+from collections import defaultdict
+
+from rich.console import Console, ConsoleOptions, RenderableType, Group
+from rich.measure import Measurement
+from rich.segment import Segment
 from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
@@ -11,7 +17,159 @@ from dnsviz_tui.models.chain import (
     TrustChain,
     ZoneInfo,
     ValidationStatus,
+    AdditionalRecord,
 )
+from dnsviz_tui.views._utils import build_header, truncate
+
+
+_get_is_signed = operator.attrgetter("is_signed")
+
+# Display order of additional record types; unlisted types go last
+_RECORD_TYPE_ORDER = {
+    rtype: i for i, rtype in enumerate(("SOA", "NS", "A", "AAAA", "MX", "TXT", "SPF", "DMARC"))
+}
+
+
+def _group_records_by_type(records: list[AdditionalRecord]) -> dict[str, list[AdditionalRecord]]:
+    """Group additional records by record type, keyed in display order."""
+    records_by_type: defaultdict[str, list[AdditionalRecord]] = defaultdict(list)
+    for record in records:
+        records_by_type[record.record_type].append(record)
+    ordered = sorted(records_by_type, key=lambda rtype: _RECORD_TYPE_ORDER.get(rtype, 99))
+    return {rtype: records_by_type[rtype] for rtype in ordered}
+
+
+@functools.lru_cache(maxsize=32)
+def _box_borders(width: int) -> tuple[str, str, str]:
+    """Return the (top, separator, bottom) border lines of a box of the given width."""
+    box_h = DiagramView.BOX_H * (width - 2)
+    return (
+        f"{DiagramView.BOX_TL}{box_h}{DiagramView.BOX_TR}",
+        f"{DiagramView.BOX_V}{box_h}{DiagramView.BOX_V}",
+        f"{DiagramView.BOX_BL}{box_h}{DiagramView.BOX_BR}",
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _zone_box(name: str, status: ValidationStatus, key_info: str, indent: str, width: int) -> Text:
+    """Return the rendered box for a zone.
+
+    Every refresh redraws the same few zones, so boxes are memoized on the
+    values they show. The returned Text is shared: append it with
+    append_text() (which copies) and never modify it in place.
+    """
+    color = status.color
+
+    # Zone name
+    if name == ".":
+        name = ". (root)"
+    name = truncate(name, width - 4)
+
+    # Status text
+    status_text = status.display_text
+
+    top, separator, bottom = _box_borders(width)
+    box_v = DiagramView.BOX_V
+    box = Text()
+
+    # Top border
+    box.append(indent)
+    box.append(f"{top}\n", style=color)
+
+    # Zone name
+    box.append(indent)
+    box.append(box_v, style=color)
+    box.append(f" {name.center(width - 4)} ", style="bold white")
+    box.append(box_v, style=color)
+    box.append("\n")
+
+    # Separator
+    box.append(indent)
+    box.append(f"{separator}\n", style=color)
+
+    # Status
+    box.append(indent)
+    box.append(box_v, style=color)
+    box.append(f" {status_text.center(width - 4)} ", style=status.bold_style)
+    box.append(box_v, style=color)
+    box.append("\n")
+
+    # Key info
+    box.append(indent)
+    box.append(box_v, style=color)
+    box.append(f" {key_info.center(width - 4)} ", style="cyan")
+    box.append(box_v, style=color)
+    box.append("\n")
+
+    # Bottom border
+    box.append(indent)
+    box.append(f"{bottom}\n", style=color)
+    return box
+
+
+@functools.lru_cache(maxsize=128)
+def _connector(ds_label: str, ds_color: str, column: int, next_column: int, indent_step: int) -> Text:
+    """Return the stepped DS connector from one zone box down to the next.
+
+    The connector starts below the box centred on column and ends at
+    next_column. Like _zone_box(), the returned Text is shared and must
+    only be appended with append_text().
+    """
+    connector_col = " " * column
+    next_col = " " * next_column
+    connector = Text()
+
+    # Vertical line down
+    connector.append(connector_col)
+    connector.append(DiagramView.LINE_V, style=ds_color)
+    connector.append("\n")
+
+    # Corner and horizontal to next column, with the DS label (one span)
+    connector.append(connector_col)
+    connector.append(
+        f"{DiagramView.CORNER_BL}{DiagramView.LINE_H * (indent_step - 1)}"
+        f"{DiagramView.CORNER_TR} {ds_label}",
+        style=ds_color,
+    )
+    connector.append("\n")
+
+    # Vertical line down to next box
+    connector.append(next_col)
+    connector.append(DiagramView.LINE_V, style=ds_color)
+    connector.append("\n")
+
+    # Arrow
+    connector.append(next_col)
+    connector.append(DiagramView.ARROW_D, style=ds_color)
+    connector.append("\n")
+    return connector
+
+
+class _CachedSegments:
+    """Render a Text once per set of layout options and replay the segments.
+
+    Rich wraps and styles a Text again on every layout pass. The waterfall
+    does not change once built, so its segments are kept per width.
+    """
+
+    _MAX_ENTRIES = 8
+
+    def __init__(self, text: Text):
+        self._text = text
+        self._segments: dict[tuple, list[Segment]] = {}
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> list[Segment]:
+        key = (options.max_width, options.justify, options.overflow, options.no_wrap)
+        segments = self._segments.get(key)
+        if segments is None:
+            # Resizing renders at many widths; keep only the recent ones
+            if len(self._segments) >= self._MAX_ENTRIES:
+                self._segments.clear()
+            segments = self._segments[key] = list(console.render(self._text, options))
+        return segments
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement.get(console, options, self._text)
 
 
 class DiagramView(Static):
@@ -41,17 +199,18 @@ class DiagramView(Static):
     def __init__(self, chain: TrustChain | None = None, **kwargs):
         super().__init__(**kwargs)
         self._chain = chain
+        # (chain, renderable) from the last render; the diagram shows nothing
+        # time-dependent, so it only changes when the chain does
+        self._render_cache: tuple[TrustChain, RenderableType] | None = None
 
     def set_chain(self, chain: TrustChain) -> None:
         """Set the trust chain to display."""
         self._chain = chain
+        self._render_cache = None
         self.refresh()
 
     def _build_waterfall_chain(self) -> Text:
         """Build centered waterfall/staircase chain diagram (trust chain only)."""
-        if not self._chain or not self._chain.zones:
-            return Text("No data")
-
         zones = self._chain.zones
         box_width = 22
         indent_step = 8
@@ -88,152 +247,51 @@ class DiagramView(Static):
 
         records = target_zone.additional_records
 
-        # Group records by type
-        records_by_type = {}
-        for record in records:
-            rtype = record.record_type
-            if rtype not in records_by_type:
-                records_by_type[rtype] = []
-            records_by_type[rtype].append(record)
-
-        # Define display order
-        type_order = ["SOA", "NS", "A", "AAAA", "MX", "TXT", "SPF", "DMARC"]
-        sorted_types = sorted(
-            records_by_type.keys(),
-            key=lambda x: type_order.index(x) if x in type_order else 99
-        )
+        # Group records by type, in display order
+        records_by_type = _group_records_by_type(records)
+        sorted_types = list(records_by_type)
 
         if not sorted_types:
             return None
 
-        # Build individual box panels for each record type
+        # Build an individual box for each record type
         boxes = []
         for rtype in sorted_types:
             recs = records_by_type[rtype]
-            is_signed = any(r.is_signed for r in recs)
+            is_signed = any(map(_get_is_signed, recs))
             color = "green" if is_signed else "grey50"
             signed_text = "[S]" if is_signed else "[U]"
             count = len(recs)
 
-            # Create box content
-            box_text = Text()
-            box_text.append(f"{rtype}\n", style="bold cyan")
-            box_text.append(f"{count} rec{'s' if count > 1 else ''}\n", style="white")
-            box_text.append(signed_text, style=color)
-
-            # Wrap in a mini panel
-            box = Panel(
-                box_text,
-                border_style=color,
-                width=12,
-                padding=(0, 1),
-            )
+            # Compose the bordered box directly as Text, matching a
+            # 12-wide rounded Panel with one column of padding
+            box = Text()
+            box.append("╭──────────╮\n", style=color)
+            for line, style in (
+                (rtype, "bold cyan"),
+                (f"{count} rec{'s' if count > 1 else ''}", "white"),
+                (signed_text, color),
+            ):
+                box.append("│", style=color)
+                box.append(" ")
+                box.append(line[:8], style=style)
+                box.append(" " * (9 - len(line[:8])))
+                box.append("│\n", style=color)
+            box.append("╰──────────╯", style=color)
             boxes.append(box)
 
         # Use Columns for automatic wrapping
         return Columns(boxes, equal=True, expand=False, padding=1)
 
-    def _build_additional_records_boxes(self, target_zone: ZoneInfo) -> Columns | None:
-        """Build additional records as dynamic columns that wrap automatically."""
-        records = target_zone.additional_records
-        if not records:
-            return None
-
-        # Group records by type
-        records_by_type = {}
-        for record in records:
-            rtype = record.record_type
-            if rtype not in records_by_type:
-                records_by_type[rtype] = []
-            records_by_type[rtype].append(record)
-
-        # Define display order
-        type_order = ["SOA", "NS", "A", "AAAA", "MX", "TXT", "SPF", "DMARC"]
-        sorted_types = sorted(
-            records_by_type.keys(),
-            key=lambda x: type_order.index(x) if x in type_order else 99
-        )
-
-        if not sorted_types:
-            return None
-
-        # Create a box for each record type
-        boxes = []
-        for rtype in sorted_types:
-            recs = records_by_type[rtype]
-            is_signed = any(r.is_signed for r in recs) if len(recs) > 1 else recs[0].is_signed
-            color = "green" if is_signed else "grey50"
-            signed_text = "[S]" if is_signed else "[U]"
-
-            # Build box as Text
-            box = Text()
-            box.append(f"┌──────┐\n", style=color)
-            box.append(f"│", style=color)
-            box.append(f"{rtype[:6].center(6)}", style="bold cyan")
-            box.append(f"│\n", style=color)
-            box.append(f"│", style=color)
-            box.append(f"{signed_text.center(6)}", style=color)
-            box.append(f"│\n", style=color)
-            box.append(f"└──────┘", style=color)
-
-            boxes.append(box)
-
-        # Use Columns which wraps automatically based on available width
-        return Columns(boxes, equal=True, expand=False)
-
     def _draw_zone_box(self, result: Text, zone: ZoneInfo, indent: str, width: int) -> None:
         """Draw a zone box."""
-        status = zone.status
-        color = status.color
-
-        # Zone name
-        name = zone.name if zone.name != "." else ". (root)"
-        if len(name) > width - 4:
-            name = name[:width - 7] + "..."
-
-        # Status text
-        status_text = f"{status.symbol} {status.value.upper()}"
-
         # Key info
         if zone.dnskeys:
-            ksk_count = sum(1 for k in zone.dnskeys if k.is_ksk)
-            zsk_count = sum(1 for k in zone.dnskeys if k.is_zsk)
-            key_info = f"KSK:{ksk_count} ZSK:{zsk_count}"
+            key_info = f"KSK:{zone.ksk_count} ZSK:{zone.zsk_count}"
         else:
             key_info = "No DNSKEY"
 
-        # Top border
-        result.append(indent)
-        result.append(f"{self.BOX_TL}{self.BOX_H * (width - 2)}{self.BOX_TR}\n", style=color)
-
-        # Zone name
-        result.append(indent)
-        result.append(self.BOX_V, style=color)
-        result.append(f" {name.center(width - 4)} ", style="bold white")
-        result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Separator
-        result.append(indent)
-        result.append(f"{self.BOX_V}{self.BOX_H * (width - 2)}{self.BOX_V}\n", style=color)
-
-        # Status
-        result.append(indent)
-        result.append(self.BOX_V, style=color)
-        result.append(f" {status_text.center(width - 4)} ", style=f"bold {color}")
-        result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Key info
-        result.append(indent)
-        result.append(self.BOX_V, style=color)
-        result.append(f" {key_info.center(width - 4)} ", style="cyan")
-        result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Bottom border
-        result.append(indent)
-        result.append(f"{self.BOX_BL}{self.BOX_H * (width - 2)}{self.BOX_BR}\n", style=color)
+        result.append_text(_zone_box(zone.name, zone.status, key_info, indent, width))
 
     def _draw_connector(self, result: Text, zone: ZoneInfo, next_zone: ZoneInfo,
                         indent: str, box_width: int, indent_step: int,
@@ -250,268 +308,9 @@ class DiagramView(Static):
             ds_label = "No DS"
             ds_color = "red"
 
-        next_indent = " " * (center_offset + (zone_idx + 1) * indent_step)
-        connector_col = indent + " " * (box_width // 2)
-
-        # Vertical line down
-        result.append(connector_col)
-        result.append(self.LINE_V, style=ds_color)
-        result.append("\n")
-
-        # Corner and horizontal to next column
-        result.append(connector_col)
-        result.append(self.CORNER_BL, style=ds_color)
-        result.append(self.LINE_H * (indent_step - 1), style=ds_color)
-        result.append(self.CORNER_TR, style=ds_color)
-        result.append(f" {ds_label}", style=ds_color)
-        result.append("\n")
-
-        # Vertical line down to next box
-        result.append(next_indent + " " * (box_width // 2))
-        result.append(self.LINE_V, style=ds_color)
-        result.append("\n")
-
-        # Arrow
-        result.append(next_indent + " " * (box_width // 2))
-        result.append(self.ARROW_D, style=ds_color)
-        result.append("\n")
-
-    def _draw_additional_records(self, result: Text, target_zone: ZoneInfo,
-                                  target_indent: int, zone_box_width: int,
-                                  record_width: int, record_step: int) -> None:
-        """Draw additional records hanging from a horizontal rail below target domain."""
-        records = target_zone.additional_records
-        if not records:
-            return
-
-        # Group records by type
-        records_by_type = {}
-        for record in records:
-            rtype = record.record_type
-            if rtype not in records_by_type:
-                records_by_type[rtype] = []
-            records_by_type[rtype].append(record)
-
-        # Define display order
-        type_order = ["SOA", "NS", "A", "AAAA", "MX", "TXT", "SPF", "DMARC"]
-        sorted_types = sorted(
-            records_by_type.keys(),
-            key=lambda x: type_order.index(x) if x in type_order else 99
-        )
-
-        num_records = len(sorted_types)
-        if num_records == 0:
-            return
-
-        # Calculate dimensions
-        box_width = 18  # Width of each record box
-        box_spacing = 2  # Space between boxes
-        total_width = num_records * box_width + (num_records - 1) * box_spacing
-
-        # Center point (below target domain)
-        center_col = target_indent + zone_box_width // 2
-
-        # Rail starts left of center, ends right of center
-        rail_start = center_col - total_width // 2
-        if rail_start < 2:
-            rail_start = 2
-
-        # Draw short vertical line down from target domain
-        result.append(" " * center_col)
-        result.append(self.LINE_V, style="blue")
-        result.append("\n")
-
-        # Build the horizontal rail with connection points
-        # First, calculate where each box center will be
-        box_centers = []
-        for i in range(num_records):
-            box_center = rail_start + i * (box_width + box_spacing) + box_width // 2
-            box_centers.append(box_center)
-
-        # Draw the horizontal rail
-        rail_end = box_centers[-1] if box_centers else center_col
-        rail_line = ""
-        current_pos = 0
-
-        # Pad to rail start
-        result.append(" " * rail_start)
-
-        # Draw rail from start to end
-        for i in range(rail_start, rail_end + 1):
-            if i == center_col:
-                # Connection point from vertical line above
-                result.append("┴", style="blue")
-            elif i in box_centers:
-                # Connection point for a box
-                result.append("┬", style="blue")
-            elif i == rail_start:
-                # Left end
-                result.append("┌", style="blue")
-            elif i == rail_end:
-                # Right end
-                result.append("┐", style="blue")
-            else:
-                result.append(self.LINE_H, style="blue")
-
-        result.append("\n")
-
-        # Draw vertical lines down from each connection point
-        for box_center in box_centers:
-            pass  # We'll draw boxes with their own connectors
-
-        # Draw the vertical connectors line
-        result.append(" " * rail_start)
-        for i in range(rail_start, rail_end + 1):
-            if i in box_centers:
-                result.append(self.LINE_V, style="blue")
-            else:
-                result.append(" ")
-        result.append("\n")
-
-        # Draw arrows
-        result.append(" " * rail_start)
-        for i in range(rail_start, rail_end + 1):
-            if i in box_centers:
-                result.append(self.ARROW_D, style="blue")
-            else:
-                result.append(" ")
-        result.append("\n")
-
-        # Now draw all boxes side by side
-        # Prepare box content for each record type
-        box_contents = []
-        for rtype in sorted_types:
-            recs = records_by_type[rtype]
-            if len(recs) > 1:
-                value = f"{len(recs)} records"
-                is_signed = any(r.is_signed for r in recs)
-            else:
-                rec = recs[0]
-                value = self._format_record_value(rtype, rec.value)
-                is_signed = rec.is_signed
-
-            color = "green" if is_signed else "grey50"
-            signed_text = "signed" if is_signed else "unsigned"
-            box_contents.append((rtype, value, signed_text, is_signed, color))
-
-        # Draw boxes line by line (all boxes at same vertical level)
-        # Line 1: Top borders
-        result.append(" " * rail_start)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(f"{self.BOX_TL}{self.BOX_H * (box_width - 2)}{self.BOX_TR}", style=color)
-        result.append("\n")
-
-        # Line 2: Record type
-        result.append(" " * rail_start)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(self.BOX_V, style=color)
-            result.append(f"{rtype.center(box_width - 2)}", style="bold cyan")
-            result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Line 3: Separator
-        result.append(" " * rail_start)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(f"{self.BOX_V}{self.BOX_H * (box_width - 2)}{self.BOX_V}", style=color)
-        result.append("\n")
-
-        # Line 4: Value
-        result.append(" " * rail_start)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            display_val = value[:box_width - 4] if len(value) > box_width - 4 else value
-            result.append(self.BOX_V, style=color)
-            result.append(f"{display_val.center(box_width - 2)}", style="white")
-            result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Line 5: Signed status
-        result.append(" " * rail_start)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(self.BOX_V, style=color)
-            result.append(f"{signed_text.center(box_width - 2)}", style=color)
-            result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Line 6: Bottom borders
-        result.append(" " * rail_start)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(f"{self.BOX_BL}{self.BOX_H * (box_width - 2)}{self.BOX_BR}", style=color)
-        result.append("\n")
-
-    def _format_record_value(self, rtype: str, value: str) -> str:
-        """Format a record value for display."""
-        if rtype == "SOA":
-            if "serial=" in value:
-                serial = value.split("serial=")[1].split()[0]
-                return f"serial={serial}"
-        elif rtype == "NS":
-            value = value.split()[0].rstrip('.')
-            if len(value) > 16:
-                return value[:13] + "..."
-        elif rtype in ("A", "AAAA"):
-            return value
-        elif rtype == "MX":
-            parts = value.split()
-            if len(parts) >= 2:
-                return f"{parts[0]} {parts[1][:12]}"
-
-        if len(value) > 16:
-            return value[:13] + "..."
-        return value
-
-    def _draw_record_box(self, result: Text, rtype: str, value: str,
-                         signed_text: str, is_signed: bool, indent: str, width: int) -> None:
-        """Draw an additional record box."""
-        color = "green" if is_signed else "grey50"
-
-        # Truncate value
-        if len(value) > width - 4:
-            value = value[:width - 7] + "..."
-
-        # Top border
-        result.append(indent)
-        result.append(f"{self.BOX_TL}{self.BOX_H * (width - 2)}{self.BOX_TR}\n", style=color)
-
-        # Record type
-        result.append(indent)
-        result.append(self.BOX_V, style=color)
-        result.append(f" {rtype.center(width - 4)} ", style="bold cyan")
-        result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Separator
-        result.append(indent)
-        result.append(f"{self.BOX_V}{self.BOX_H * (width - 2)}{self.BOX_V}\n", style=color)
-
-        # Value
-        result.append(indent)
-        result.append(self.BOX_V, style=color)
-        result.append(f" {value.center(width - 4)} ", style="white")
-        result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Signed status
-        result.append(indent)
-        result.append(self.BOX_V, style=color)
-        result.append(f" {signed_text.center(width - 4)} ", style=color)
-        result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Bottom border
-        result.append(indent)
-        result.append(f"{self.BOX_BL}{self.BOX_H * (width - 2)}{self.BOX_BR}\n", style=color)
+        column = len(indent) + box_width // 2
+        next_column = center_offset + (zone_idx + 1) * indent_step + box_width // 2
+        result.append_text(_connector(ds_label, ds_color, column, next_column, indent_step))
 
     def _build_summary_table(self) -> Table:
         """Build a summary table of the chain."""
@@ -533,9 +332,7 @@ class DiagramView(Static):
             status = Text(f"{zone.status.symbol} {zone.status.value}", style=zone.status.color)
 
             if zone.dnskeys:
-                ksk = sum(1 for k in zone.dnskeys if k.is_ksk)
-                zsk = sum(1 for k in zone.dnskeys if k.is_zsk)
-                keys = Text(f"{ksk}K/{zsk}Z", style="cyan")
+                keys = Text(f"{zone.ksk_count}K/{zone.zsk_count}Z", style="cyan")
             else:
                 keys = Text("-", style="dim")
 
@@ -549,7 +346,7 @@ class DiagramView(Static):
                 ds_val = Text("-", style="dim")
 
             if zone.rrsigs:
-                valid_count = sum(1 for r in zone.rrsigs if r.is_valid)
+                valid_count = zone.valid_rrsig_count
                 total = len(zone.rrsigs)
                 if valid_count == total:
                     sigs = Text(f"{total} valid", style="green")
@@ -594,10 +391,7 @@ class DiagramView(Static):
 
         for record in target_zone.additional_records:
             # Truncate long values (SOA needs more space for serial)
-            value = record.value
-            max_len = 90 if record.record_type == "SOA" else 50
-            if len(value) > max_len:
-                value = value[:max_len - 3] + "..."
+            value = truncate(record.value, 90 if record.record_type == "SOA" else 50)
 
             signed = Text("Yes", style="green") if record.is_signed else Text("No", style="grey50")
 
@@ -611,147 +405,6 @@ class DiagramView(Static):
 
         return table
 
-    def _build_additional_records_section(self) -> Text:
-        """Build a standalone additional records section with horizontal layout."""
-        if not self._chain:
-            return Text("")
-
-        target_zone = self._chain.target_zone
-        if not target_zone or not target_zone.additional_records:
-            return Text("")
-
-        records = target_zone.additional_records
-
-        # Group records by type
-        records_by_type = {}
-        for record in records:
-            rtype = record.record_type
-            if rtype not in records_by_type:
-                records_by_type[rtype] = []
-            records_by_type[rtype].append(record)
-
-        # Define display order
-        type_order = ["SOA", "NS", "A", "AAAA", "MX", "TXT", "SPF", "DMARC"]
-        sorted_types = sorted(
-            records_by_type.keys(),
-            key=lambda x: type_order.index(x) if x in type_order else 99
-        )
-
-        num_records = len(sorted_types)
-        if num_records == 0:
-            return Text("")
-
-        result = Text()
-        box_width = 18
-        box_spacing = 2
-
-        # Prepare box content for each record type
-        box_contents = []
-        for rtype in sorted_types:
-            recs = records_by_type[rtype]
-            if len(recs) > 1:
-                value = f"{len(recs)} records"
-                is_signed = any(r.is_signed for r in recs)
-            else:
-                rec = recs[0]
-                value = self._format_record_value(rtype, rec.value)
-                is_signed = rec.is_signed
-
-            color = "green" if is_signed else "grey50"
-            signed_text = "signed" if is_signed else "unsigned"
-            box_contents.append((rtype, value, signed_text, is_signed, color))
-
-        # Calculate total width and centering
-        total_width = num_records * box_width + (num_records - 1) * box_spacing
-        start_indent = max(2, (80 - total_width) // 2)
-        indent = " " * start_indent
-
-        # Draw horizontal rail at top
-        result.append(indent)
-        rail_width = total_width
-        result.append(f"{self.BOX_TL}{self.LINE_H * (rail_width - 2)}{self.BOX_TR}", style="blue")
-        result.append("\n")
-
-        # Draw connection points
-        result.append(indent)
-        for i in range(num_records):
-            box_center_offset = i * (box_width + box_spacing) + box_width // 2
-            # Pad to this position
-            if i == 0:
-                result.append(" " * (box_width // 2))
-            else:
-                result.append(" " * (box_spacing + box_width - 1))
-            result.append(self.LINE_V, style="blue")
-        result.append("\n")
-
-        # Draw arrows
-        result.append(indent)
-        for i in range(num_records):
-            if i == 0:
-                result.append(" " * (box_width // 2))
-            else:
-                result.append(" " * (box_spacing + box_width - 1))
-            result.append(self.ARROW_D, style="blue")
-        result.append("\n")
-
-        # Draw boxes line by line
-        # Line 1: Top borders
-        result.append(indent)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(f"{self.BOX_TL}{self.BOX_H * (box_width - 2)}{self.BOX_TR}", style=color)
-        result.append("\n")
-
-        # Line 2: Record type
-        result.append(indent)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(self.BOX_V, style=color)
-            result.append(f"{rtype.center(box_width - 2)}", style="bold cyan")
-            result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Line 3: Separator
-        result.append(indent)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(f"{self.BOX_V}{self.BOX_H * (box_width - 2)}{self.BOX_V}", style=color)
-        result.append("\n")
-
-        # Line 4: Value
-        result.append(indent)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            display_val = value[:box_width - 4] if len(value) > box_width - 4 else value
-            result.append(self.BOX_V, style=color)
-            result.append(f"{display_val.center(box_width - 2)}", style="white")
-            result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Line 5: Signed status
-        result.append(indent)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(self.BOX_V, style=color)
-            result.append(f"{signed_text.center(box_width - 2)}", style=color)
-            result.append(self.BOX_V, style=color)
-        result.append("\n")
-
-        # Line 6: Bottom borders
-        result.append(indent)
-        for i, (rtype, value, signed_text, is_signed, color) in enumerate(box_contents):
-            if i > 0:
-                result.append(" " * box_spacing)
-            result.append(f"{self.BOX_BL}{self.BOX_H * (box_width - 2)}{self.BOX_BR}", style=color)
-        result.append("\n")
-
-        return result
-
     def render(self) -> RenderableType:
         """Render the diagram view."""
         if not self._chain:
@@ -761,24 +414,19 @@ class DiagramView(Static):
                 border_style="dim",
             )
 
+        # Layout and resize passes re-render the same chain
+        if self._render_cache is not None and self._render_cache[0] is self._chain:
+            return self._render_cache[1]
+
         # Create header
-        header = Table.grid(padding=(0, 2))
-        header.add_column()
-        header.add_column()
-        header.add_column()
-
-        status_text = Text()
-        status_text.append(f"{self._chain.overall_status.symbol} ", style=f"bold {self._chain.overall_status.color}")
-        status_text.append(self._chain.overall_status.value.upper(), style=f"bold {self._chain.overall_status.color}")
-
-        header.add_row(
-            Text(f"Domain: {self._chain.target_domain}", style="bold"),
-            status_text,
-            Text(f"Query: {self._chain.query_duration_ms:.0f}ms", style="dim"),
-        )
+        header = build_header(self._chain)
+
+        # A failed query leaves no zones: show the header and the reason only
+        if not self._chain.zones:
+            return self._chain_panel(Group(header, Text(""), Text("No data", style="dim")))
 
         # Build waterfall chain (trust chain only)
-        chain_viz = self._build_waterfall_chain()
+        chain_viz = _CachedSegments(self._build_waterfall_chain())
 
         # Build attached records diagram (dynamic boxes)
         attached_records = self._build_attached_records_diagram()
@@ -825,6 +473,12 @@ class DiagramView(Static):
 
         content = Group(*elements)
 
+        panel = self._chain_panel(content)
+        self._render_cache = (self._chain, panel)
+        return panel
+
+    def _chain_panel(self, content: RenderableType) -> Panel:
+        """Wrap content in the diagram panel, titled with the chain's outcome."""
         return Panel(
             content,
             title="[bold]Chain of Trust - Diagram View[/bold]",
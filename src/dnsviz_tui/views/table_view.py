@@ -1,16 +1,15 @@
 """Table view visualization for DNSSEC chain of trust."""
 
+import time
+
 from rich.console import RenderableType, Group
 from rich.text import Text
 from rich.panel import Panel
 from rich.table import Table
 from textual.widgets import Static
 
-from dnsviz_tui.models.chain import (
-    TrustChain,
-    ZoneInfo,
-    ValidationStatus,
-)
+from dnsviz_tui.models.chain import TrustChain
+from dnsviz_tui.views._utils import build_header, truncate
 
 
 class TableView(Static):
@@ -26,10 +25,12 @@ class TableView(Static):
     def __init__(self, chain: TrustChain | None = None, **kwargs):
         super().__init__(**kwargs)
         self._chain = chain
+        self._render_cache: tuple[TrustChain, RenderableType] | None = None
 
     def set_chain(self, chain: TrustChain) -> None:
         """Set the trust chain to display."""
         self._chain = chain
+        self._render_cache = None
         self.refresh()
 
     def _build_dnskey_table(self) -> Table:
@@ -44,11 +45,11 @@ class TableView(Static):
         )
 
         table.add_column("Zone", style="bold")
-        table.add_column("Type", justify="center")
-        table.add_column("Key Tag", justify="right", style="cyan")
+        table.add_column("Type", justify="center", width=4, no_wrap=True)
+        table.add_column("Key Tag", justify="right", style="cyan", width=7, no_wrap=True)
         table.add_column("Algorithm", style="yellow")
         table.add_column("Bits", justify="right")
-        table.add_column("Flags", justify="right", style="dim")
+        table.add_column("Flags", justify="right", style="dim", width=5, no_wrap=True)
         table.add_column("Key (truncated)", style="dim", max_width=24)
 
         for zone in self._chain.zones:
@@ -79,11 +80,11 @@ class TableView(Static):
         )
 
         table.add_column("Zone", style="bold")
-        table.add_column("Key Tag", justify="right", style="cyan")
+        table.add_column("Key Tag", justify="right", style="cyan", width=7, no_wrap=True)
         table.add_column("Algorithm", style="yellow")
         table.add_column("Digest Type")
         table.add_column("Digest (truncated)", style="dim", max_width=32)
-        table.add_column("Validates", justify="center")
+        table.add_column("Validates", justify="center", width=9, no_wrap=True)
 
         for zone in self._chain.zones:
             for ds in zone.ds_records:
@@ -117,22 +118,24 @@ class TableView(Static):
 
         table.add_column("Zone", style="bold")
         table.add_column("Covers", style="cyan")
-        table.add_column("Key Tag", justify="right")
+        table.add_column("Key Tag", justify="right", width=7, no_wrap=True)
         table.add_column("Algorithm", style="yellow")
-        table.add_column("Expiration")
+        table.add_column("Expiration", width=10, no_wrap=True)
         table.add_column("Status", justify="center")
 
+        now = time.time()
         for zone in self._chain.zones:
             for rrsig in zone.rrsigs:
                 # Determine status and color
-                if rrsig.is_expired:
+                expired, not_yet_valid, days = rrsig.snapshot(now)
+                if expired:
                     status = Text("EXPIRED", style="bold red")
                     exp_style = "red"
-                elif rrsig.is_not_yet_valid:
+                elif not_yet_valid:
                     status = Text("NOT VALID", style="bold yellow")
                     exp_style = "yellow"
-                elif rrsig.days_until_expiry < 7:
-                    status = Text(f"{rrsig.days_until_expiry}d left", style="yellow")
+                elif days < 7:
+                    status = Text(f"{days}d left", style="yellow")
                     exp_style = "yellow"
                 else:
                     status = Text("✓ Valid", style="green")
@@ -167,15 +170,15 @@ class TableView(Static):
 
         table.add_column("Zone", style="bold")
         table.add_column("Status", justify="center")
-        table.add_column("DS Valid", justify="center")
+        table.add_column("DS Valid", justify="center", width=8, no_wrap=True)
         table.add_column("DNSKEY Valid", justify="center")
-        table.add_column("Chain OK", justify="center")
+        table.add_column("Chain OK", justify="center", width=8, no_wrap=True)
         table.add_column("Reason")
 
         for zone in self._chain.zones:
             status = Text(
-                f"{zone.status.symbol} {zone.status.value.upper()}",
-                style=f"bold {zone.status.color}"
+                zone.status.display_text,
+                style=zone.status.bold_style
             )
 
             ds_valid = Text("✓", style="green") if zone.ds_validated else Text("-", style="dim")
@@ -186,9 +189,7 @@ class TableView(Static):
             if zone.name == ".":
                 ds_valid = Text("⚓", style="magenta")  # Anchor symbol
 
-            reason = zone.status_reason if zone.status_reason else "-"
-            if len(reason) > 40:
-                reason = reason[:37] + "..."
+            reason = truncate(zone.status_reason, 40) if zone.status_reason else "-"
 
             table.add_row(
                 zone.name,
@@ -220,7 +221,7 @@ class TableView(Static):
         )
 
         table.add_column("Zone", style="bold")
-        table.add_column("Servers", justify="center")
+        table.add_column("Servers", justify="center", width=7, no_wrap=True)
         table.add_column("Status", justify="center")
         table.add_column("Issues")
 
@@ -246,8 +247,7 @@ class TableView(Static):
                 issues_text = "; ".join(c.issues[:2])
                 if len(c.issues) > 2:
                     issues_text += f" (+{len(c.issues) - 2} more)"
-                if len(issues_text) > 50:
-                    issues_text = issues_text[:47] + "..."
+                issues_text = truncate(issues_text, 50)
             else:
                 issues_text = "-"
 
@@ -283,16 +283,13 @@ class TableView(Static):
         table.add_column("Name", style="bold")
         table.add_column("Value")
         table.add_column("TTL", justify="right", style="dim")
-        table.add_column("Signed", justify="center")
+        table.add_column("Signed", justify="center", width=6, no_wrap=True)
 
         for record in all_records:
             signed = Text("✓", style="green") if record.is_signed else Text("-", style="dim")
 
-            value = record.value
             # SOA records need more space to show serial
-            max_len = 90 if record.record_type == "SOA" else 60
-            if len(value) > max_len:
-                value = value[:max_len - 3] + "..."
+            value = truncate(record.value, 90 if record.record_type == "SOA" else 60)
 
             table.add_row(
                 record.record_type,
@@ -313,21 +310,11 @@ class TableView(Static):
                 border_style="dim",
             )
 
-        # Create header
-        header = Table.grid(padding=(0, 2))
-        header.add_column()
-        header.add_column()
-        header.add_column()
-
-        status_text = Text()
-        status_text.append(f"{self._chain.overall_status.symbol} ", style=f"bold {self._chain.overall_status.color}")
-        status_text.append(self._chain.overall_status.value.upper(), style=f"bold {self._chain.overall_status.color}")
+        # Layout and resize passes re-render the same chain
+        if self._render_cache is not None and self._render_cache[0] is self._chain:
+            return self._render_cache[1]
 
-        header.add_row(
-            Text(f"Domain: {self._chain.target_domain}", style="bold"),
-            status_text,
-            Text(f"Query: {self._chain.query_duration_ms:.0f}ms", style="dim"),
-        )
+        header = build_header(self._chain)
 
         # Build all tables
         tables = [
@@ -354,10 +341,12 @@ class TableView(Static):
 
         content = Group(*tables)
 
-        return Panel(
+        panel = Panel(
             content,
             title="[bold]Chain of Trust - Table View[/bold]",
             subtitle=f"[dim]{self._chain.overall_reason}[/dim]",
             border_style=self._chain.overall_status.color,
             padding=(1, 2),
         )
+        self._render_cache = (self._chain, panel)
+        return panel
@@ -1,10 +1,9 @@
 """Tree view visualization for DNSSEC chain of trust."""
 
-from rich.console import RenderableType
+from rich.console import RenderableType, Group
 from rich.text import Text
 from rich.tree import Tree
 from rich.panel import Panel
-from rich.table import Table
 from textual.widgets import Static
 
 from dnsviz_tui.models.chain import (
@@ -15,6 +14,7 @@ from dnsviz_tui.models.chain import (
     DSInfo,
     RRSIGInfo,
 )
+from dnsviz_tui.views._utils import build_header, truncate
 
 
 class TreeView(Static):
@@ -30,15 +30,17 @@ class TreeView(Static):
     def __init__(self, chain: TrustChain | None = None, **kwargs):
         super().__init__(**kwargs)
         self._chain = chain
+        self._render_cache: tuple[TrustChain, RenderableType] | None = None
 
     def set_chain(self, chain: TrustChain) -> None:
         """Set the trust chain to display."""
         self._chain = chain
+        self._render_cache = None
         self.refresh()
 
     def _status_badge(self, status: ValidationStatus) -> Text:
         """Create a colored status badge."""
-        return Text(f" {status.symbol} {status.value.upper()} ", style=f"bold {status.color} on {status.color}20")
+        return Text(f" {status.display_text} ", style=f"bold {status.color} on {status.color}20")
 
     def _format_key_info(self, key: DNSKeyInfo) -> Text:
         """Format a DNSKEY for display."""
@@ -93,14 +95,15 @@ class TreeView(Static):
         text.append(" | ")
 
         # Validity status with color
-        if rrsig.is_expired:
+        expired, not_yet_valid, days = rrsig.snapshot()
+        if expired:
             text.append(f"EXPIRED", style="bold red")
-        elif rrsig.is_not_yet_valid:
+        elif not_yet_valid:
             text.append("NOT YET VALID", style="bold yellow")
-        elif rrsig.days_until_expiry < 7:
-            text.append(f"expires in {rrsig.days_until_expiry}d", style="yellow")
+        elif days < 7:
+            text.append(f"expires in {days}d", style="yellow")
         else:
-            text.append(f"valid {rrsig.days_until_expiry}d", style="green")
+            text.append(f"valid {days}d", style="green")
 
         return text
 
@@ -110,7 +113,7 @@ class TreeView(Static):
         zone_label = Text()
         zone_label.append(f"{zone.name}", style="bold white")
         zone_label.append(" ")
-        zone_label.append(f"[{zone.status.symbol} {zone.status.value.upper()}]", style=zone.status.color)
+        zone_label.append(f"[{zone.status.display_text}]", style=zone.status.color)
 
         branch = tree.add(zone_label)
 
@@ -144,10 +147,7 @@ class TreeView(Static):
                 rec_text.append(f"{record.record_type}", style="cyan")
                 rec_text.append(": ")
                 # Truncate long values (SOA needs more space for serial)
-                value = record.value
-                max_len = 90 if record.record_type == "SOA" else 60
-                if len(value) > max_len:
-                    value = value[:max_len - 3] + "..."
+                value = truncate(record.value, 90 if record.record_type == "SOA" else 60)
                 rec_text.append(value, style="dim")
                 if record.is_signed:
                     rec_text.append(" [signed]", style="green")
@@ -164,21 +164,11 @@ class TreeView(Static):
                 border_style="dim",
             )
 
-        # Create header
-        header = Table.grid(padding=(0, 2))
-        header.add_column()
-        header.add_column()
-        header.add_column()
+        # Layout and resize passes re-render the same chain
+        if self._render_cache is not None and self._render_cache[0] is self._chain:
+            return self._render_cache[1]
 
-        status_text = Text()
-        status_text.append(f"{self._chain.overall_status.symbol} ", style=f"bold {self._chain.overall_status.color}")
-        status_text.append(self._chain.overall_status.value.upper(), style=f"bold {self._chain.overall_status.color}")
-
-        header.add_row(
-            Text(f"Domain: {self._chain.target_domain}", style="bold"),
-            status_text,
-            Text(f"Query: {self._chain.query_duration_ms:.0f}ms", style="dim"),
-        )
+        header = build_header(self._chain)
 
         # Build the tree
         tree = Tree(
@@ -191,13 +181,14 @@ class TreeView(Static):
             self._build_zone_branch(tree, zone)
 
         # Create panel with tree
-        from rich.console import Group
         content = Group(header, Text(""), tree)
 
-        return Panel(
+        panel = Panel(
             content,
             title="[bold]Chain of Trust - Tree View[/bold]",
             subtitle=f"[dim]{self._chain.overall_reason}[/dim]",
             border_style=self._chain.overall_status.color,
             padding=(1, 2),
         )
+        self._render_cache = (self._chain, panel)
+        return panel
@@ -21,14 +21,14 @@ class DomainValidator(Validator):
 
         value = value.strip()
 
+        # Check length first, it is cheaper than the pattern
+        if len(value) > 253:
+            return self.failure("Domain name too long")
+
         # Check for valid characters
         if not self.DOMAIN_PATTERN.match(value):
             return self.failure("Invalid domain format")
 
-        # Check length
-        if len(value) > 253:
-            return self.failure("Domain name too long")
-
         return self.success()
 
 
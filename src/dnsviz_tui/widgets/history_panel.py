@@ -1,12 +1,11 @@
 """History panel widget for showing query history."""
 
 from textual.widgets import Static, ListView, ListItem, Label
-from textual.containers import Vertical, Container
+from textual.containers import Container
 from textual.message import Message
 from rich.text import Text
-from rich.panel import Panel
 
-from dnsviz_tui.models.chain import TrustChain, ValidationStatus
+from dnsviz_tui.models.chain import TrustChain
 
 
 class HistoryItem(ListItem):
@@ -94,6 +93,8 @@ class HistoryPanel(Container):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._history: list[TrustChain] = []
+        # List items, kept in the same order as _history
+        self._items: list[HistoryItem] = []
 
     def compose(self):
         """Compose the history panel."""
@@ -103,14 +104,29 @@ class HistoryPanel(Container):
 
     def add_entry(self, chain: TrustChain) -> None:
         """Add a new entry to the history."""
+        list_view = self.query_one("#history-list", ListView)
+
+        # Mount the new item at the top, then drop any older entry for the
+        # same domain, rather than rebuilding the whole list. Widget.mount
+        # rather than ListView.insert, which needs a newer Textual.
+        item = HistoryItem(chain, 0)
+        list_view.mount(item, before=0)
+        list_view.index = None
+
         # Don't add duplicates
-        for existing in self._history:
+        for i, existing in enumerate(self._history):
             if existing.target_domain == chain.target_domain:
-                self._history.remove(existing)
+                del self._history[i]
+                self._items.pop(i).remove()
                 break
 
         self._history.insert(0, chain)
-        self._rebuild_list()
+        self._items.insert(0, item)
+        for i, existing_item in enumerate(self._items):
+            existing_item.index = i
+
+        if len(self._history) == 1:
+            self.query_one("#empty-message", Static).display = False
 
     def _rebuild_list(self) -> None:
         """Rebuild the history list view."""
@@ -118,12 +134,11 @@ class HistoryPanel(Container):
         empty_msg = self.query_one("#empty-message", Static)
 
         list_view.clear()
+        self._items = [HistoryItem(chain, i) for i, chain in enumerate(self._history)]
 
         if self._history:
             empty_msg.display = False
-            for i, chain in enumerate(self._history):
-                item = HistoryItem(chain, i)
-                list_view.append(item)
+            list_view.extend(self._items)
         else:
             empty_msg.display = True
 
@@ -4,7 +4,28 @@ from textual.widgets import Static
 from rich.text import Text
 from rich.table import Table
 
-from dnsviz_tui.models.chain import TrustChain, ValidationStatus
+from dnsviz_tui.models.chain import TrustChain
+
+
+# Key hints shown in the centre of the bar
+_BINDINGS = (
+    ("Enter", "Query"),
+    ("1/2/3", "View"),
+    ("e", "Export"),
+    ("r", "Resolver"),
+    ("h", "History"),
+    ("q", "Quit"),
+)
+
+# Fixed left-hand states, shared by every render
+_LOADING_TEXT = Text.assemble(("⏳ Loading...", "yellow"))
+_READY_TEXT = Text.assemble(("Ready", "dim"))
+
+_VIEW_LABELS = {
+    "tree": "🌳 Tree",
+    "diagram": "📊 Diagram",
+    "table": "📋 Table",
+}
 
 
 class StatusBar(Static):
@@ -27,6 +48,14 @@ class StatusBar(Static):
         self._resolver: str = "default"
         self._loading: bool = False
 
+        # The keybindings never change, so build their text once
+        self._bindings_text = Text()
+        for i, (key, action) in enumerate(_BINDINGS):
+            if i > 0:
+                self._bindings_text.append(" │ ", style="dim")
+            self._bindings_text.append(key, style="bold cyan")
+            self._bindings_text.append(f" {action}", style="dim")
+
     def set_chain(self, chain: TrustChain | None) -> None:
         """Set the current chain."""
         self._chain = chain
@@ -55,43 +84,21 @@ class StatusBar(Static):
         table.add_column(ratio=1, justify="right")  # Right: view mode
 
         # Left: Current status
-        left = Text()
         if self._loading:
-            left.append("⏳ Loading...", style="yellow")
+            left = _LOADING_TEXT
         elif self._chain:
             status = self._chain.overall_status
+            left = Text()
             left.append(f"{status.symbol} ", style=status.color)
             left.append(self._chain.target_domain, style="bold")
         else:
-            left.append("Ready", style="dim")
-
-        # Center: Keybindings
-        center = Text()
-        bindings = [
-            ("Enter", "Query"),
-            ("1/2/3", "View"),
-            ("e", "Export"),
-            ("r", "Resolver"),
-            ("h", "History"),
-            ("q", "Quit"),
-        ]
-
-        for i, (key, action) in enumerate(bindings):
-            if i > 0:
-                center.append(" │ ", style="dim")
-            center.append(key, style="bold cyan")
-            center.append(f" {action}", style="dim")
+            left = _READY_TEXT
 
         # Right: View mode and resolver
         right = Text()
-        view_labels = {
-            "tree": "🌳 Tree",
-            "diagram": "📊 Diagram",
-            "table": "📋 Table",
-        }
-        right.append(view_labels.get(self._view_mode, self._view_mode), style="bold")
+        right.append(_VIEW_LABELS.get(self._view_mode, self._view_mode), style="bold")
         right.append(" │ ", style="dim")
         right.append(f"DNS: {self._resolver}", style="dim")
 
-        table.add_row(left, center, right)
+        table.add_row(left, self._bindings_text, right)
         return table
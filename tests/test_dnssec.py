@@ -0,0 +1,114 @@
+"""Tests for DS to DNSKEY validation."""
+
+import base64
+import random
+
+import dns.dnssec
+import dns.name
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
+import pytest
+
+from dnsviz_tui.dns import dnssec
+from dnsviz_tui.dns.dnssec import DNSSECValidator
+from dnsviz_tui.dns.records import RecordFormatter
+from dnsviz_tui.dns.resolver import DNSResolver
+from dnsviz_tui.models.chain import ZoneInfo
+
+ZONE = "example.com."
+
+
+def _dnskey(seed: int, flags: int = 257):
+    """Build ECDSA P-256 DNSKEY rdata with a random key."""
+    key = base64.b64encode(random.Random(seed).randbytes(64)).decode()
+    return dns.rdata.from_text(dns.rdataclass.IN, dns.rdatatype.DNSKEY, f"{flags} 3 13 {key}")
+
+
+def _ds(dnskey, digest: str):
+    """Build the parsed DS record for a DNSKEY of ZONE."""
+    # SHA-1 DS records are still published, though dnspython's default
+    # policy no longer creates them
+    ds = dns.dnssec.make_ds(
+        dns.name.from_text(ZONE), dnskey, digest, policy=dns.dnssec.allow_all_policy
+    )
+    return RecordFormatter.parse_ds(ds)
+
+
+def _zone(*dnskeys) -> ZoneInfo:
+    return ZoneInfo(name=ZONE, dnskeys=[RecordFormatter.parse_dnskey(k) for k in dnskeys])
+
+
+@pytest.fixture
+def validator():
+    return DNSSECValidator(DNSResolver(nameservers=["127.0.0.1"]))
+
+
+def test_all_ds_for_the_matched_key_are_marked(validator):
+    key = _dnskey(1)
+    zone = _zone(key)
+    ds_records = [_ds(key, "SHA1"), _ds(key, "SHA256")]
+
+    valid, reason, tag = validator._validate_ds_to_dnskey(zone, ds_records)
+
+    assert valid
+    assert tag == zone.dnskeys[0].key_tag
+    assert [ds.validates_key for ds in ds_records] == [tag, tag]
+    assert reason == f"DS validates DNSKEY(s) [{tag}] (2/2 DS records)"
+
+
+def test_stronger_digest_is_checked_before_sha1(validator, monkeypatch):
+    key = _dnskey(2)
+    zone = _zone(key)
+    ds_records = [_ds(key, "SHA1"), _ds(key, "SHA256")]
+
+    digest_types = []
+    compute = dnssec._ds_digest_cached
+
+    def recording(name_wire, rdata, digest_type):
+        digest_types.append(digest_type)
+        return compute(name_wire, rdata, digest_type)
+
+    monkeypatch.setattr(dnssec, "_ds_digest_cached", recording)
+    validator._validate_ds_to_dnskey(zone, ds_records)
+
+    assert digest_types == [2, 1]
+
+
+def test_stops_after_first_validated_key(validator):
+    first, second = _dnskey(3), _dnskey(4)
+    zone = _zone(first, second)
+    ds_records = [_ds(first, "SHA256"), _ds(second, "SHA256")]
+
+    valid, reason, tag = validator._validate_ds_to_dnskey(zone, ds_records)
+
+    assert valid
+    assert ds_records[0].validates_key == tag
+    assert ds_records[1].validates_key is None
+    assert reason == f"DS validates DNSKEY(s) [{tag}] (1/1 DS records checked)"
+
+
+def test_exhaustive_checks_every_ds(validator):
+    first, second = _dnskey(5), _dnskey(6)
+    zone = _zone(first, second)
+    ds_records = [_ds(first, "SHA256"), _ds(second, "SHA256")]
+
+    valid, reason, _ = validator._validate_ds_to_dnskey(zone, ds_records, exhaustive=True)
+
+    assert valid
+    assert [ds.validates_key for ds in ds_records] == [k.key_tag for k in zone.dnskeys]
+    assert reason.endswith("(2/2 DS records)")
+
+
+def test_digest_mismatch_fails(validator):
+    key = _dnskey(7)
+    zone = _zone(key)
+    ds = _ds(key, "SHA256")
+    ds.digest_bytes = bytes(len(ds.digest_bytes))
+
+    valid, reason, tag = validator._validate_ds_to_dnskey(zone, [ds])
+
+    assert not valid
+    assert tag is None
+    assert reason == f"DS validation failed: DS tag={ds.key_tag} digest mismatch"
+    assert ds.validates_key is None
@@ -0,0 +1,121 @@
+"""Tests for JSON export."""
+
+from datetime import datetime
+
+import pytest
+
+from dnsviz_tui.export import json_export
+from dnsviz_tui.export.json_export import export_json, write_json
+from dnsviz_tui.models.chain import (
+    AdditionalRecord,
+    DNSKeyInfo,
+    DSInfo,
+    RRSIGInfo,
+    TrustChain,
+    ValidationStatus,
+    ZoneInfo,
+)
+
+
+def _make_chain() -> TrustChain:
+    """Build a small signed chain: the root and one child zone."""
+    rrsig = RRSIGInfo(
+        type_covered="DNSKEY",
+        algorithm=13,
+        algorithm_name="ECDSAP256SHA256",
+        labels=2,
+        original_ttl=3600,
+        expiration_ts=4102444800,
+        inception_ts=1704067200,
+        key_tag=12345,
+        signer_name="example.com.",
+        signature="c2lnbmF0dXJl",
+        is_valid=True,
+    )
+    zone = ZoneInfo(
+        name="example.com.",
+        parent=".",
+        status=ValidationStatus.SECURE,
+        status_reason="Chain validated",
+        dnskeys=[
+            DNSKeyInfo(
+                flags=257,
+                protocol=3,
+                algorithm=13,
+                algorithm_name="ECDSAP256SHA256",
+                key_tag=12345,
+                key_data="a2V5ZGF0YQ==",
+                key_length=256,
+            ),
+        ],
+        ds_records=[
+            DSInfo(
+                key_tag=12345,
+                algorithm=13,
+                algorithm_name="ECDSAP256SHA256",
+                digest_type=2,
+                digest_type_name="SHA-256",
+                digest="AB" * 32,
+                validates_key=12345,
+            ),
+        ],
+        rrsigs=[rrsig],
+        additional_records=[
+            AdditionalRecord(
+                record_type="TXT",
+                name="example.com.",
+                value='"contact: José Müller <admin@example.com>"',
+                ttl=300,
+                is_signed=True,
+            ),
+        ],
+    )
+    return TrustChain(
+        target_domain="example.com",
+        query_time=datetime(2026, 1, 1),
+        zones=[ZoneInfo(name=".", status=ValidationStatus.SECURE), zone],
+        overall_status=ValidationStatus.SECURE,
+        overall_reason="Chain validated",
+        resolver_used="127.0.0.1",
+    )
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib encoder."""
+    if request.param == "orjson":
+        if json_export.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_export, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("zones", [2, 0])
+def test_streamed_file_matches_string_export(backend, tmp_path, zones):
+    chain = _make_chain()
+    chain.zones = chain.zones[:zones]
+    path = tmp_path / "export.json"
+
+    write_json(chain, path)
+    assert path.read_text(encoding="utf-8") == export_json(chain)
+
+
+def test_export_json_writes_and_returns_string(backend, tmp_path):
+    chain = _make_chain()
+    path = tmp_path / "nested" / "export.json"
+
+    result = export_json(chain, path)
+    assert result == export_json(chain)
+    assert path.read_text(encoding="utf-8") == result
+
+
+def test_backends_produce_identical_output(monkeypatch):
+    if json_export.orjson is None:
+        pytest.skip("orjson is not installed")
+    chain = _make_chain()
+    fast = export_json(chain)
+    monkeypatch.setattr(json_export, "orjson", None)
+
+    assert export_json(chain) == fast
+    assert "José Müller" in fast
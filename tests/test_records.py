@@ -0,0 +1,52 @@
+"""Tests for DNS record parsing helpers."""
+
+import base64
+import random
+
+import dns.dnssec
+import dns.rdata
+import dns.rdataclass
+import dns.rdatatype
+import pytest
+
+from dnsviz_tui.dns.records import RecordFormatter, compute_key_tag
+
+
+def _dnskey(flags: int, algorithm: int, key: bytes):
+    """Build DNSKEY rdata from raw key bytes."""
+    text = f"{flags} 3 {algorithm} {base64.b64encode(key).decode()}"
+    return dns.rdata.from_text(dns.rdataclass.IN, dns.rdatatype.DNSKEY, text)
+
+
+@pytest.mark.parametrize("algorithm, key_size", [
+    (8, 260),    # RSA/SHA-256, 2048-bit
+    (8, 259),    # odd RDATA length
+    (13, 64),    # ECDSA P-256
+    (14, 96),    # ECDSA P-384
+    (15, 32),    # Ed25519
+])
+def test_compute_key_tag_matches_dnspython(algorithm, key_size):
+    rng = random.Random(algorithm * 1000 + key_size)
+    for flags in (256, 257):
+        for _ in range(50):
+            rdata = _dnskey(flags, algorithm, rng.randbytes(key_size))
+            assert compute_key_tag(rdata.to_wire()) == dns.dnssec.key_id(rdata)
+
+
+def test_compute_key_tag_rsamd5_uses_modulus_low_bits():
+    rng = random.Random(1)
+    for _ in range(50):
+        key = rng.randbytes(131)
+        rdata = _dnskey(257, 1, key)
+        wire = rdata.to_wire()
+        assert compute_key_tag(wire) == dns.dnssec.key_id(rdata)
+        assert compute_key_tag(wire) == int.from_bytes(key[-3:-1], "big")
+
+
+def test_parse_dnskey_round_trips_rdata():
+    rdata = _dnskey(257, 13, random.Random(2).randbytes(64))
+    key = RecordFormatter.parse_dnskey(rdata)
+
+    assert key.key_tag == dns.dnssec.key_id(rdata)
+    assert key.is_ksk
+    assert key.rdata == rdata.to_wire()
@@ -0,0 +1,71 @@
+"""Tests for the resolver's in-memory answer cache."""
+
+import pytest
+
+from dnsviz_tui.dns import resolver as resolver_module
+from dnsviz_tui.dns.resolver import DNSResolver
+
+KEY = ("example.com.", "DNSKEY")
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(resolver_module.time, "monotonic", clock)
+    return clock
+
+
+def test_answer_expires_after_its_ttl(clock):
+    resolver = DNSResolver(nameservers=["127.0.0.1"])
+    answer = object()
+    resolver._cache_put(KEY, answer, 60)
+
+    clock.now += 59
+    assert resolver._cache_get(KEY) is answer
+    clock.now += 2
+    assert resolver._cache_get(KEY) is None
+    assert KEY not in resolver._cache
+
+
+def test_ttl_is_capped_at_cache_max_ttl(clock):
+    resolver = DNSResolver(nameservers=["127.0.0.1"])
+    answer = object()
+    resolver._cache_put(KEY, answer, 86400)
+
+    clock.now += DNSResolver.CACHE_MAX_TTL - 1
+    assert resolver._cache_get(KEY) is answer
+    clock.now += 2
+    assert resolver._cache_get(KEY) is None
+
+
+def test_cache_max_ttl_argument_overrides_default(clock):
+    resolver = DNSResolver(nameservers=["127.0.0.1"], cache_max_ttl=10)
+    resolver._cache_put(KEY, object(), 3600)
+
+    clock.now += 11
+    assert resolver._cache_get(KEY) is None
+
+
+def test_non_positive_ttl_is_not_cached(clock):
+    resolver = DNSResolver(nameservers=["127.0.0.1"])
+    resolver._cache_put(KEY, object(), 0)
+
+    assert resolver._cache_get(KEY) is None
+
+
+def test_set_nameservers_drops_cached_answers(clock):
+    resolver = DNSResolver(nameservers=["127.0.0.1"])
+    resolver._cache_put(KEY, object(), 60)
+    resolver.set_nameservers(["127.0.0.2"])
+
+    assert resolver._cache_get(KEY) is None